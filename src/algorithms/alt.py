@@ -0,0 +1,122 @@
+from __future__ import annotations
+import math
+import random
+from array import array
+from typing import Callable, Dict, Hashable, List, Literal, Optional, Tuple
+from .astar import astar
+from .dijkstra_adj_list_bin_heap import dijkstra_binary_heap
+
+Strategy = Literal["random", "farthest", "degree"]
+
+class LandmarkOracle:
+    """ALT distance oracle: A* with landmark lower bounds from the triangle inequality.
+
+    For every landmark L we keep d(L, v) (and d(v, L) on directed graphs) as a
+    flat array of doubles indexed like self.labels, so a landmark costs 8 bytes
+    per vertex (16 on directed graphs).
+    """
+
+    def __init__(self, graph, num_landmarks: int = 8, strategy: Strategy = "farthest", seed: Optional[int] = None) -> None:
+        self.graph = graph
+        self.labels: List[Hashable] = list(graph.nodes())
+        self.index: Dict[Hashable, int] = {label: i for i, label in enumerate(self.labels)}
+        self.directed: bool = graph.is_directed()
+        # Reverse graph for the d(v, L) arrays, only needed on directed graphs
+        self.reverse = graph.reverse(copy=False) if self.directed else None
+
+        self.landmarks: List[Hashable] = []
+        self.from_landmark: List[array] = []
+        self.to_landmark: List[array] = []
+
+        rng = random.Random(seed)
+        num_landmarks = min(num_landmarks, len(self.labels))
+
+        if strategy == "random":
+            for landmark in rng.sample(self.labels, num_landmarks):
+                self._add_landmark(landmark)
+        elif strategy == "degree":
+            by_degree = sorted(self.labels, key=graph.degree, reverse=True)
+            for landmark in by_degree[:num_landmarks]:
+                self._add_landmark(landmark)
+        elif strategy == "farthest":
+            self._select_farthest(num_landmarks, rng)
+        else:
+            raise ValueError(f"Unknown landmark selection strategy {strategy!r}.")
+
+    def _add_landmark(self, landmark: Hashable) -> None:
+        # One full Dijkstra per landmark and direction
+        distances, _ = dijkstra_binary_heap(self.graph, landmark)
+        from_landmark = array('d', [distances[label] for label in self.labels])
+
+        if self.directed:
+            distances, _ = dijkstra_binary_heap(self.reverse, landmark)
+            to_landmark = array('d', [distances[label] for label in self.labels])
+        else:
+            to_landmark = from_landmark
+
+        self.landmarks.append(landmark)
+        self.from_landmark.append(from_landmark)
+        self.to_landmark.append(to_landmark)
+
+    def _select_farthest(self, num_landmarks: int, rng: random.Random) -> None:
+        # Start anywhere, then repeatedly take the reachable vertex farthest from
+        # all chosen landmarks. Vertices the landmarks cannot reach are skipped,
+        # otherwise small disconnected components would soak up the landmarks.
+        self._add_landmark(rng.choice(self.labels))
+        closest = list(self.from_landmark[0])
+
+        while len(self.landmarks) < num_landmarks:
+            chosen = set(self.landmarks)
+            candidates = [i for i, label in enumerate(self.labels) if label not in chosen and closest[i] < math.inf]
+            if not candidates:
+                break
+
+            farthest = max(candidates, key=closest.__getitem__)
+            self._add_landmark(self.labels[farthest])
+            closest = [min(a, b) for a, b in zip(closest, self.from_landmark[-1])]
+
+    def memory_per_landmark(self) -> int:
+        """Bytes of distance data stored per landmark."""
+
+        if not self.landmarks:
+            return 0
+
+        distances = self.from_landmark[0]
+        return len(distances) * distances.itemsize * (2 if self.directed else 1)
+
+    def lower_bound(self, node: Hashable, target: Hashable) -> float:
+        return self.heuristic(target)(node)
+
+    def heuristic(self, target: Hashable) -> Callable[[Hashable], float]:
+        index = self.index
+        t = index[target]
+        # Per target only the pairs (array, fixed term) are needed
+        terms: List[Tuple[array, float, array, float]] = [
+            (from_landmark, from_landmark[t], to_landmark, to_landmark[t])
+            for from_landmark, to_landmark in zip(self.from_landmark, self.to_landmark)
+        ]
+        inf = math.inf
+
+        def heuristic(node):
+            v = index[node]
+            bound = 0
+            for from_landmark, landmark_to_target, to_landmark, target_to_landmark in terms:
+                landmark_to_node = from_landmark[v]
+                # d(v, t) >= d(L, t) - d(L, v)
+                if landmark_to_node < inf:
+                    if landmark_to_target == inf:
+                        return inf # L reaches v but not t, so v cannot reach t either
+                    if landmark_to_target - landmark_to_node > bound:
+                        bound = landmark_to_target - landmark_to_node
+                # d(v, t) >= d(v, L) - d(t, L)
+                node_to_landmark = to_landmark[v]
+                if node_to_landmark < inf and target_to_landmark < inf and node_to_landmark - target_to_landmark > bound:
+                    bound = node_to_landmark - target_to_landmark
+            return bound
+
+        return heuristic
+
+    def query(self, source, target, engine: Literal["binary", "fibonacci"] = "binary") -> Tuple[float, List[Hashable], int]:
+        """Returns (distance, path, number of settled nodes), like astar()."""
+
+        return astar(self.graph, source, target, self.heuristic(target), engine)
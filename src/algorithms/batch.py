@@ -0,0 +1,57 @@
+from __future__ import annotations
+import multiprocessing
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Hashable, Iterable, Iterator, Optional, Tuple
+from .data_structures.csr_graph import CSRGraph
+from .dijkstra_csr_bin_heap import dijkstra_csr_arrays, to_label_dicts
+
+# Set once per worker process by _init_worker, keyed by dataset name (None
+# for dijkstra_many's single graph). Thread pools set it in the calling process
+worker_graphs: Dict[Optional[str], CSRGraph] = {}
+
+def _init_worker(graphs: Dict[Optional[str], CSRGraph]) -> None:
+    global worker_graphs
+    worker_graphs = graphs
+
+
+def _solve(source: int, dataset: Optional[str] = None) -> Tuple[int, array, array]:
+    dist, pred = dijkstra_csr_arrays(worker_graphs[dataset], source)
+    # Flat arrays pickle far more compactly than label dicts
+    return source, array('d', dist), array('q', pred)
+
+
+def default_context():
+    # With fork the workers inherit the CSR arrays copy-on-write and nothing is
+    # pickled at all; other start methods pickle the graph once per worker
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
+
+
+def dijkstra_many(graph, sources: Iterable[Hashable], max_workers: Optional[int] = None, mp_context=None) -> Iterator[Tuple[Hashable, dict, dict]]:
+    """Yields (source, distances, predecessors) for every source, in completion order."""
+
+    csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_networkx(graph)
+
+    sources = list(sources)
+    for source in sources:
+        if source not in csr.index:
+            raise ValueError(f"Source node {source!r} is not in the graph.")
+
+    pool = ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=mp_context or default_context(),
+        initializer=_init_worker,
+        initargs=({None: csr},),
+    )
+
+    try:
+        futures = [pool.submit(_solve, csr.index[source]) for source in sources]
+        for future in as_completed(futures):
+            source, dist, pred = future.result()
+            distances, predecessors = to_label_dicts(csr, dist, pred)
+            yield csr.labels[source], distances, predecessors
+    finally:
+        # Also reached when the consumer stops iterating early
+        pool.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,101 @@
+from __future__ import annotations
+import math
+from typing import Container, Dict, Hashable, Iterable, Iterator, Literal, Mapping, NamedTuple, Optional, Union
+from .shortest_path import frontiers
+
+# Local searches that stop early, built on the frontiers of shortest_path.py.
+# They are generators: vertices come out in settle order (non-decreasing
+# distance), and the search only goes as far as the consumer iterates.
+
+class Settled(NamedTuple):
+    node: Hashable
+    distance: float
+    # The seed the vertex was reached from, i.e. its nearest source
+    origin: Hashable
+    predecessor: Optional[Hashable]
+
+
+Sources = Union[Hashable, Iterable[Hashable], Mapping[Hashable, float]]
+
+def _seeds(graph, sources: Sources) -> Dict[Hashable, float]:
+    # A single node, several nodes, or {node: starting distance}
+    if isinstance(sources, Mapping):
+        seeds = dict(sources)
+    elif sources in graph:
+        seeds = {sources: 0}
+    else:
+        seeds = {source: 0 for source in sources}
+
+    for source in seeds:
+        if source not in graph:
+            raise ValueError(f"Source node {source!r} is not in the graph.")
+
+    return seeds
+
+
+def settle_order(graph, sources: Sources, radius: float = math.inf, engine: Literal["binary", "fibonacci"] = "binary") -> Iterator[Settled]:
+    """Yields the vertices reachable from the nearest source within radius, closest first.
+
+    With several sources every vertex is reported once, from the source
+    closest to it, like a Voronoi partition of the graph.
+    """
+
+    if engine not in frontiers:
+        raise ValueError(f"Unknown engine {engine!r}, expected one of {list(frontiers)}.")
+
+    frontier = frontiers[engine]()
+    distances = frontier.distances
+    origins: Dict[Hashable, Hashable] = {}
+    predecessors: Dict[Hashable, Optional[Hashable]] = {}
+    settled = set()
+
+    for source, distance in _seeds(graph, sources).items():
+        if distance <= radius:
+            frontier.push(source, distance)
+            origins[source] = source
+            predecessors[source] = None
+
+    while True:
+        key = frontier.peek_key(settled)
+        if key == math.inf or key > radius:
+            return
+
+        current_distance, current_node = frontier.pop(settled)
+        settled.add(current_node)
+        yield Settled(current_node, current_distance, origins[current_node], predecessors[current_node])
+
+        for neighbor, edge_data in graph.adj[current_node].items():
+            if neighbor in settled:
+                continue
+
+            # Vertices beyond the radius never enter the frontier
+            new_distance = current_distance + edge_data.get('weight', 1)
+            if new_distance <= radius and new_distance < distances.get(neighbor, math.inf):
+                frontier.push(neighbor, new_distance)
+                origins[neighbor] = origins[current_node]
+                predecessors[neighbor] = current_node
+
+
+def within_radius(graph, sources: Sources, radius: float, engine: Literal["binary", "fibonacci"] = "binary") -> Iterator[Settled]:
+    """Isochrone: every vertex at distance <= radius from the nearest source, closest first."""
+
+    return settle_order(graph, sources, radius, engine)
+
+
+def k_nearest(graph, sources: Sources, k: int, targets: Optional[Container[Hashable]] = None, engine: Literal["binary", "fibonacci"] = "binary") -> Iterator[Settled]:
+    """The k vertices closest to the sources, closest first.
+
+    With targets (e.g. a set of facilities) only those vertices count
+    towards k. The sources themselves are included if they qualify.
+    """
+
+    if k <= 0:
+        return
+
+    found = 0
+    for item in settle_order(graph, sources, engine=engine):
+        if targets is None or item.node in targets:
+            yield item
+            found += 1
+            if found == k:
+                return
@@ -0,0 +1,147 @@
+from __future__ import annotations
+import sys
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+from .dijkstra_adj_list_bin_heap import dijkstra_binary_heap
+
+def graph_fingerprint(graph, weight: str = 'weight') -> int:
+    """Hash of the node set, the edge set and the edge weights.
+
+    It is O(V + E), which is still several times cheaper than a Dijkstra run,
+    and is recomputed on every lookup so that mutated graphs are never served
+    stale results.
+    """
+
+    # adjacency() yields the raw dicts, which is much cheaper than graph.edges(data=True)
+    adjacency = dict(graph.adjacency())
+    return hash((
+        graph.is_directed(),
+        tuple(adjacency),
+        tuple([tuple(neighbors) for neighbors in adjacency.values()]),
+        tuple([edge_data.get(weight, 1) for neighbors in adjacency.values() for edge_data in neighbors.values()]),
+    ))
+
+
+def result_size(distances: dict, predecessors: dict) -> int:
+    # Shallow estimate: the two dicts plus the per-node predecessor lists
+    size = sys.getsizeof(distances) + sys.getsizeof(predecessors)
+    for preds in predecessors.values():
+        if isinstance(preds, list):
+            size += sys.getsizeof(preds)
+
+    return size
+
+
+class LRUCache:
+    """Least recently used mapping, bounded by an entry count and/or an estimated byte budget.
+
+    Shared by ShortestPathCache and the query services, so that every result
+    cache evicts the same way and reports the same stats.
+    """
+
+    def __init__(self, max_entries: Optional[int] = 128, max_bytes: Optional[int] = None) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        # key -> (value, estimated size in bytes)
+        self.entries: OrderedDict[Hashable, Tuple[Any, int]] = OrderedDict()
+        self.total_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key: Hashable, value: Any, size: int = 0) -> None:
+        # An entry that alone exceeds the byte budget is never stored
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+
+        if key in self.entries:
+            self.total_bytes -= self.entries.pop(key)[1]
+        self.entries[key] = (value, size)
+        self.total_bytes += size
+        self._evict()
+
+    def _evict(self) -> None:
+        while self.entries and (
+            (self.max_entries is not None and len(self.entries) > self.max_entries)
+            or (self.max_bytes is not None and self.total_bytes > self.max_bytes)
+        ):
+            _, (_, size) = self.entries.popitem(last=False)
+            self.total_bytes -= size
+            self.evictions += 1
+
+    def discard(self, keys: Iterable[Hashable]) -> None:
+        for key in list(keys):
+            if key in self.entries:
+                self.total_bytes -= self.entries.pop(key)[1]
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.total_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self.entries),
+            "bytes": self.total_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+class ShortestPathCache(LRUCache):
+    """LRU cache of (distances, predecessors) per (graph fingerprint, source).
+
+    Call it like the engine it wraps. Cached results are returned as-is, so
+    callers must not mutate them.
+    """
+
+    def __init__(self, engine: Callable = dijkstra_binary_heap, max_entries: Optional[int] = 128, max_bytes: Optional[int] = None) -> None:
+        super().__init__(max_entries, max_bytes)
+        self.engine = engine
+        # Last fingerprint seen per graph object, to drop entries once it is mutated.
+        # Weak, so graphs that are garbage collected are forgotten
+        self.graph_fingerprints: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def __call__(self, graph, source):
+        fingerprint = graph_fingerprint(graph)
+
+        previous = self.graph_fingerprints.get(graph)
+        if previous is not None and previous != fingerprint:
+            self.invalidate(previous)
+        self.graph_fingerprints[graph] = fingerprint
+
+        key = (fingerprint, source)
+        result = self.get(key)
+        if result is not None:
+            return result
+
+        distances, predecessors = self.engine(graph, source)
+        self.put(key, (distances, predecessors), result_size(distances, predecessors))
+
+        return distances, predecessors
+
+    def invalidate(self, fingerprint: int) -> None:
+        self.discard([key for key in self.entries if key[0] == fingerprint])
+
+    def clear(self) -> None:
+        super().clear()
+        self.graph_fingerprints.clear()
@@ -0,0 +1,287 @@
+from __future__ import annotations
+import hashlib
+import heapq
+import math
+import pickle
+from array import array
+from typing import Dict, Hashable, List, Optional, Tuple
+
+FORMAT_VERSION = 1
+
+def graph_digest(graph, weight: str = 'weight') -> str:
+    """SHA-256 of the nodes, edges and weights.
+
+    Unlike cache.graph_fingerprint it is stable across processes (str hashes
+    are salted), so it can be saved with an index and checked on load.
+    """
+
+    digest = hashlib.sha256(repr(graph.is_directed()).encode())
+    for u, neighbors in graph.adjacency():
+        digest.update(repr((u, [(v, edge_data.get(weight, 1)) for v, edge_data in neighbors.items()])).encode())
+
+    return digest.hexdigest()
+
+
+class ContractionHierarchy:
+    """Contraction Hierarchies index for repeated point-to-point queries on a static graph.
+
+    Vertices are contracted in importance order. Every vertex keeps its edges
+    to higher-ranked vertices: outgoing ones in the forward graph, incoming
+    ones in the backward graph. Shortcut edges store the contracted middle
+    vertex (-1 for original edges) so paths can be unpacked.
+    """
+
+    def __init__(self, labels: List[Hashable], rank: array, forward: Tuple[array, array, array, array], backward: Tuple[array, array, array, array], digest: Optional[str] = None) -> None:
+        self.labels: List[Hashable] = labels
+        self.index: Dict[Hashable, int] = {label: i for i, label in enumerate(labels)}
+        self.rank = rank
+        # (offsets, targets, weights, middles) in CSR layout
+        self.forward = forward
+        self.backward = backward
+        # graph_digest of the graph the index was built from
+        self.digest = digest
+
+    @property
+    def num_shortcuts(self) -> int:
+        return sum(1 for m in self.forward[3] if m >= 0) + sum(1 for m in self.backward[3] if m >= 0)
+
+    @classmethod
+    def build(cls, graph, weight: str = 'weight', witness_limit: int = 64) -> ContractionHierarchy:
+        labels = list(graph.nodes())
+        index = {label: i for i, label in enumerate(labels)}
+        V = len(labels)
+
+        out_edges: List[Dict[int, float]] = [{} for _ in range(V)]
+        in_edges: List[Dict[int, float]] = [{} for _ in range(V)]
+
+        def add_edge(u, v, w):
+            if u != v and w < out_edges[u].get(v, math.inf):
+                out_edges[u][v] = w
+                in_edges[v][u] = w
+
+        for u, v, edge_data in graph.edges(data=True):
+            w = edge_data.get(weight, 1)
+            add_edge(index[u], index[v], w)
+            if not graph.is_directed():
+                add_edge(index[v], index[u], w)
+
+        # (u, x) -> middle vertex, for shortcuts that are currently in the overlay graph
+        middle: Dict[Tuple[int, int], int] = {}
+        deleted_neighbors = [0] * V
+        rank = array('q', [0] * V)
+        forward_edges: List[List[Tuple[int, float, int]]] = [[] for _ in range(V)]
+        backward_edges: List[List[Tuple[int, float, int]]] = [[] for _ in range(V)]
+
+        def witness_search(source, skip, limit):
+            # Bounded Dijkstra that avoids the vertex being contracted. Tentative
+            # distances are real path lengths, so they are all valid witnesses.
+            distances = {source: 0}
+            pq = [(0, source)]
+            settled = 0
+            while pq and settled < witness_limit:
+                d, u = heapq.heappop(pq)
+                if d > distances[u]:
+                    continue
+                if d > limit:
+                    break
+                settled += 1
+                for x, w in out_edges[u].items():
+                    if x == skip:
+                        continue
+                    nd = d + w
+                    if nd < distances.get(x, math.inf):
+                        distances[x] = nd
+                        heapq.heappush(pq, (nd, x))
+            return distances
+
+        def shortcuts_for(v):
+            shortcuts = []
+            outgoing = list(out_edges[v].items())
+            if not outgoing:
+                return shortcuts
+
+            max_out = max(w for _, w in outgoing)
+            for u, w_uv in in_edges[v].items():
+                distances = witness_search(u, v, w_uv + max_out)
+                for x, w_vx in outgoing:
+                    if x != u and distances.get(x, math.inf) > w_uv + w_vx:
+                        shortcuts.append((u, x, w_uv + w_vx))
+
+            return shortcuts
+
+        def priority(v):
+            # Edge difference plus the number of already contracted neighbours
+            removed = len(in_edges[v]) + len(out_edges[v])
+            return len(shortcuts_for(v)) - removed + deleted_neighbors[v]
+
+        pq = [(priority(v), v) for v in range(V)]
+        heapq.heapify(pq)
+
+        for level in range(V):
+            # Lazy updates: re-evaluate the top and only contract it if it stays on top
+            while True:
+                _, v = heapq.heappop(pq)
+                current = priority(v)
+                if not pq or current <= pq[0][0]:
+                    break
+                heapq.heappush(pq, (current, v))
+
+            for u, x, w in shortcuts_for(v):
+                if w < out_edges[u].get(x, math.inf):
+                    out_edges[u][x] = w
+                    in_edges[x][u] = w
+                    middle[(u, x)] = v
+
+            # Every remaining neighbour gets contracted later, i.e. has a higher rank
+            rank[v] = level
+            forward_edges[v] = [(x, w, middle.get((v, x), -1)) for x, w in out_edges[v].items()]
+            backward_edges[v] = [(u, w, middle.get((u, v), -1)) for u, w in in_edges[v].items()]
+
+            for u in in_edges[v]:
+                del out_edges[u][v]
+                deleted_neighbors[u] += 1
+            for x in out_edges[v]:
+                del in_edges[x][v]
+                deleted_neighbors[x] += 1
+            out_edges[v] = {}
+            in_edges[v] = {}
+
+        return cls(labels, rank, cls._to_csr(forward_edges), cls._to_csr(backward_edges), graph_digest(graph, weight))
+
+    @staticmethod
+    def _to_csr(edges: List[List[Tuple[int, float, int]]]) -> Tuple[array, array, array, array]:
+        offsets, targets, weights, middles = array('q', [0]), array('q'), array('d'), array('q')
+        for vertex_edges in edges:
+            for x, w, m in vertex_edges:
+                targets.append(x)
+                weights.append(w)
+                middles.append(m)
+            offsets.append(len(targets))
+
+        return offsets, targets, weights, middles
+
+    def query(self, source, target) -> Tuple[float, List[Hashable]]:
+        """Returns (distance, path), or (inf, []) if target is unreachable."""
+
+        if source not in self.index or target not in self.index:
+            raise ValueError("Source or target node is not in the graph.")
+
+        s, t = self.index[source], self.index[target]
+        if s == t:
+            return 0, [source]
+
+        # Bidirectional search that only ever moves up the hierarchy
+        sides = (
+            (self.forward, {s: 0}, {s: -1}, [(0, s)]),
+            (self.backward, {t: 0}, {t: -1}, [(0, t)]),
+        )
+        best = math.inf
+        meeting_node = -1
+
+        while True:
+            forward_key = sides[0][3][0][0] if sides[0][3] else math.inf
+            backward_key = sides[1][3][0][0] if sides[1][3] else math.inf
+            if min(forward_key, backward_key) >= best:
+                break
+
+            side = 0 if forward_key <= backward_key else 1
+            (offsets, targets, weights, _), distances, predecessors, pq = sides[side]
+            other_distances = sides[1 - side][1]
+
+            d, u = heapq.heappop(pq)
+            if d > distances[u]:
+                continue
+
+            if u in other_distances and d + other_distances[u] < best:
+                best = d + other_distances[u]
+                meeting_node = u
+
+            lo, hi = offsets[u], offsets[u + 1]
+            for x, w in zip(targets[lo:hi], weights[lo:hi]):
+                nd = d + w
+                if nd < distances.get(x, math.inf):
+                    distances[x] = nd
+                    predecessors[x] = u
+                    heapq.heappush(pq, (nd, x))
+
+        if meeting_node < 0:
+            return math.inf, []
+
+        # Chain of hierarchy vertices source -> meeting node -> target
+        up = []
+        node = meeting_node
+        while node >= 0:
+            up.append(node)
+            node = sides[0][2][node]
+        up.reverse()
+        node = sides[1][2][meeting_node]
+        while node >= 0:
+            up.append(node)
+            node = sides[1][2][node]
+
+        path = [up[0]]
+        for a, b in zip(up, up[1:]):
+            self._unpack(a, b, path)
+
+        # Summing the original weights in path order reproduces the distance
+        # plain Dijkstra computes bit for bit, independent of shortcut rounding
+        distance = 0
+        for a, b in zip(path, path[1:]):
+            distance = distance + self._edge(a, b)[0]
+
+        return distance, [self.labels[i] for i in path]
+
+    def _edge(self, a: int, b: int) -> Tuple[float, int]:
+        # An edge a -> b is stored at its lower-ranked endpoint
+        if self.rank[b] > self.rank[a]:
+            offsets, targets, weights, middles = self.forward
+            u, x = a, b
+        else:
+            offsets, targets, weights, middles = self.backward
+            u, x = b, a
+
+        best = None
+        for i in range(offsets[u], offsets[u + 1]):
+            if targets[i] == x and (best is None or weights[i] < weights[best]):
+                best = i
+
+        return weights[best], middles[best]
+
+    def _unpack(self, a: int, b: int, path: List[int]) -> None:
+        # Appends the original vertices after a up to and including b
+        stack = [(a, b)]
+        while stack:
+            u, x = stack.pop()
+            m = self._edge(u, x)[1]
+            if m < 0:
+                path.append(x)
+            else:
+                stack.append((m, x))
+                stack.append((u, m))
+
+    def save(self, path: str) -> None:
+        with open(path, 'wb') as f:
+            pickle.dump({
+                "version": FORMAT_VERSION,
+                "labels": self.labels,
+                "rank": self.rank,
+                "forward": self.forward,
+                "backward": self.backward,
+                "digest": self.digest,
+            }, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path: str) -> ContractionHierarchy:
+        with open(path, 'rb') as f:
+            data = pickle.load(f)
+
+        if data.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported contraction hierarchy format in {path}.")
+
+        # Indexes saved before digests were stored load with None, which matches no graph
+        return cls(data["labels"], data["rank"], data["forward"], data["backward"], data.get("digest"))
+
+    def matches(self, graph, weight: str = 'weight') -> bool:
+        """Whether graph is the one the index was built from, i.e. the index is not stale."""
+
+        return self.digest is not None and self.digest == graph_digest(graph, weight)
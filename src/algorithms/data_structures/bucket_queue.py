@@ -0,0 +1,107 @@
+from __future__ import annotations
+from typing import Hashable, List, Tuple
+
+# Both queues are monotone: a pushed key may never be smaller than the last
+# popped one, which always holds for Dijkstra with non-negative weights. Like
+# the heapq version they use lazy deletion, so callers skip stale entries.
+# Keys that break these rules raise instead of landing in the wrong bucket.
+
+def integer_key(key) -> int:
+    # float(key) also rejects inf and NaN, which are not integers
+    if not float(key).is_integer():
+        raise ValueError(f"Bucket queue keys must be integers, got {key!r}.")
+
+    return int(key)
+
+
+class DialQueue:
+    """Dial's algorithm: a circular array of max_weight + 1 buckets indexed by key.
+
+    Keys must be non-negative integers. Every key in the queue lies within
+    max_weight of the last popped key, so key % (max_weight + 1) is unique.
+    """
+
+    def __init__(self, max_weight: int) -> None:
+        if max_weight < 0:
+            raise ValueError("Maximum edge weight must be non-negative.")
+
+        self.max_weight = max_weight
+        self.buckets: List[List[Hashable]] = [[] for _ in range(max_weight + 1)]
+        self.current: int = 0
+        self.size: int = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def push(self, key: int, value: Hashable) -> None:
+        key = integer_key(key)
+        if key < self.current or key > self.current + self.max_weight:
+            raise ValueError(f"Dial queue key {key} is outside [{self.current}, {self.current + self.max_weight}].")
+
+        self.buckets[key % len(self.buckets)].append(value)
+        self.size += 1
+
+    def pop(self) -> Tuple[int, Hashable]:
+        if self.size == 0:
+            raise IndexError("pop from an empty queue")
+
+        buckets = self.buckets
+        count = len(buckets)
+        current = self.current
+        while not buckets[current % count]:
+            current += 1
+
+        self.current = current
+        self.size -= 1
+        return current, buckets[current % count].pop()
+
+
+class RadixHeap:
+    """Monotone radix heap for non-negative integer keys.
+
+    Bucket i holds keys whose highest bit differing from the last popped key
+    is bit i - 1 (bucket 0 holds keys equal to it), so each entry moves to a
+    lower bucket at most once per bit.
+    """
+
+    def __init__(self) -> None:
+        self.buckets: List[List[Tuple[int, Hashable]]] = [[]]
+        self.last: int = 0
+        self.size: int = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _bucket(self, key: int) -> int:
+        return (key ^ self.last).bit_length()
+
+    def push(self, key: int, value: Hashable) -> None:
+        key = integer_key(key)
+        if key < self.last:
+            raise ValueError("Radix heap keys must not decrease below the last popped key.")
+
+        i = self._bucket(key)
+        while len(self.buckets) <= i:
+            self.buckets.append([])
+        self.buckets[i].append((key, value))
+        self.size += 1
+
+    def pop(self) -> Tuple[int, Hashable]:
+        if self.size == 0:
+            raise IndexError("pop from an empty queue")
+
+        buckets = self.buckets
+        if not buckets[0]:
+            # Refill bucket 0 from the first non-empty bucket, relative to its minimum
+            i = 1
+            while not buckets[i]:
+                i += 1
+
+            entries = buckets[i]
+            buckets[i] = []
+            self.last = min(key for key, _ in entries)
+            for key, value in entries:
+                buckets[self._bucket(key)].append((key, value))
+
+        self.size -= 1
+        return buckets[0].pop()
@@ -0,0 +1,191 @@
+from __future__ import annotations
+import json
+import mmap
+import struct
+from array import array
+from typing import Dict, Hashable, Iterable, Iterator, List, Sequence, Tuple
+import numpy as np
+
+# Binary layout: header, offsets (int64, V + 1), targets (int64, E),
+# weights (float64, E), then the labels as a JSON array, so labels must be
+# JSON scalars. Arrays are in native byte order.
+MAGIC = b"CSRG"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sIIIQQQQ")
+
+class CSRGraph:
+    """Compressed sparse row graph.
+
+    The out-edges of the vertex with index ``u`` live in
+    ``targets[offsets[u]:offsets[u + 1]]`` and ``weights[offsets[u]:offsets[u + 1]]``.
+    Node labels are mapped to the indices ``0..V-1`` once, on construction.
+    """
+
+    def __init__(self, offsets: Sequence[int], targets: Sequence[int], weights: Sequence[float], labels: List[Hashable], directed: bool = False) -> None:
+        # offsets has V + 1 entries, targets and weights have E entries each
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.labels: List[Hashable] = labels
+        self.index: Dict[Hashable, int] = {label: i for i, label in enumerate(labels)}
+        self.directed: bool = directed
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.labels)
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.targets)
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def __contains__(self, label: Hashable) -> bool:
+        return label in self.index
+
+    def edges_of(self, u: int) -> Iterator[Tuple[int, float]]:
+        lo, hi = self.offsets[u], self.offsets[u + 1]
+        return zip(self.targets[lo:hi], self.weights[lo:hi])
+
+    def degree(self, u: int) -> int:
+        return self.offsets[u + 1] - self.offsets[u]
+
+    def as_numpy(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # Zero-copy views over the underlying buffers
+        return (
+            np.frombuffer(self.offsets, dtype=np.int64),
+            np.frombuffer(self.targets, dtype=np.int64),
+            np.frombuffer(self.weights, dtype=np.float64),
+        )
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[Tuple[Hashable, Hashable, float]], labels: Iterable[Hashable] = (), directed: bool = False) -> CSRGraph:
+        index: Dict[Hashable, int] = {}
+        node_labels: List[Hashable] = []
+
+        def intern(label):
+            i = index.get(label)
+            if i is None:
+                i = index[label] = len(node_labels)
+                node_labels.append(label)
+            return i
+
+        for label in labels:
+            intern(label)
+
+        sources = array('q')
+        targets = array('q')
+        weights = array('d')
+        for u, v, w in edges:
+            ui, vi = intern(u), intern(v)
+            sources.append(ui)
+            targets.append(vi)
+            weights.append(w)
+            if not directed:
+                sources.append(vi)
+                targets.append(ui)
+                weights.append(w)
+
+        return cls.from_coo(sources, targets, weights, node_labels, directed)
+
+    @classmethod
+    def from_networkx(cls, graph, weight: str = 'weight', default_weight: float = 1.0) -> CSRGraph:
+        labels = list(graph.nodes())
+        index = {label: i for i, label in enumerate(labels)}
+
+        offsets = array('q', [0])
+        targets = array('q')
+        weights = array('d')
+
+        # adjacency() already lists both directions for undirected graphs,
+        # and yields the raw dicts, which are much cheaper to walk than graph.adj views
+        for _, neighbors in graph.adjacency():
+            targets.extend([index[v] for v in neighbors])
+            weights.extend([edge_data.get(weight, default_weight) for edge_data in neighbors.values()])
+            offsets.append(len(targets))
+
+        return cls(offsets, targets, weights, labels, graph.is_directed())
+
+    @classmethod
+    def from_coo(cls, sources: array, targets: array, weights: array, labels: List[Hashable], directed: bool) -> CSRGraph:
+        V = len(labels)
+        src = np.frombuffer(sources, dtype=np.int64)
+        order = np.argsort(src, kind='stable')
+
+        offsets = np.zeros(V + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=V), out=offsets[1:])
+
+        return cls(
+            array('q', offsets.tobytes()),
+            array('q', np.frombuffer(targets, dtype=np.int64)[order].tobytes()),
+            array('d', np.frombuffer(weights, dtype=np.float64)[order].tobytes()),
+            labels,
+            directed,
+        )
+
+    def __reduce__(self):
+        # Buffers backed by an mmap cannot be pickled, so ship plain arrays
+        return (type(self), (
+            array('q', bytes(self.offsets)),
+            array('q', bytes(self.targets)),
+            array('d', bytes(self.weights)),
+            self.labels,
+            self.directed,
+        ))
+
+    def save(self, path: str) -> None:
+        labels = json.dumps(self.labels).encode()
+        V, E = self.num_nodes, self.num_edges
+        labels_start = HEADER.size + 8 * (V + 1) + 16 * E
+
+        with open(path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, FORMAT_VERSION, int(self.directed), 0, V, E, labels_start, len(labels)))
+            for buffer in (self.offsets, self.targets, self.weights):
+                f.write(memoryview(buffer).cast('B'))
+            f.write(labels)
+
+    @classmethod
+    def load(cls, path: str) -> CSRGraph:
+        """Memory-maps a file written by save(); the arrays are zero-copy views into it."""
+
+        with open(path, 'rb') as f:
+            # The mapping stays alive for as long as the views into it do
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, directed, _, V, E, labels_start, labels_length = HEADER.unpack_from(mapped)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"{path} is not a CSR graph file (version {FORMAT_VERSION}).")
+
+        view = memoryview(mapped)
+        start = HEADER.size
+        offsets = view[start:start + 8 * (V + 1)].cast('q')
+        start += 8 * (V + 1)
+        targets = view[start:start + 8 * E].cast('q')
+        start += 8 * E
+        weights = view[start:start + 8 * E].cast('d')
+        labels = json.loads(bytes(view[labels_start:labels_start + labels_length]))
+
+        return cls(offsets, targets, weights, labels, bool(directed))
+
+    def to_networkx(self):
+        import networkx as nx
+
+        graph = nx.DiGraph() if self.directed else nx.Graph()
+        graph.add_nodes_from(self.labels)
+        labels = self.labels
+
+        offsets, targets, weights = self.as_numpy()
+        sources = np.repeat(np.arange(self.num_nodes, dtype=np.int64), np.diff(offsets))
+        if not self.directed:
+            # Each undirected edge is stored in both directions, add it once
+            keep = sources <= targets
+            sources, targets, weights = sources[keep], targets[keep], weights[keep]
+
+        graph.add_weighted_edges_from(zip(
+            [labels[u] for u in sources.tolist()],
+            [labels[v] for v in targets.tolist()],
+            weights.tolist(),
+        ))
+
+        return graph
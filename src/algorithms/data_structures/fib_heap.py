@@ -3,6 +3,9 @@ import math
 from typing import Optional, List, Hashable
 
 class Node:
+    # No per-instance __dict__: a large heap holds one of these per vertex
+    __slots__ = ('key', 'value', 'parent', 'child', 'left', 'right', 'degree', 'mark')
+
     def __init__(self, key: float, value: Hashable):
         # for priority
         self.key: float = key
@@ -20,9 +23,16 @@ class FibonacciHeap:
     def __init__(self) -> None:
         self.min_node: Optional[Node] = None
         self.total_nodes: int = 0
+        # Released nodes, reused by insert instead of allocating new ones
+        self.pool: List[Node] = []
 
     def insert(self, key: float, value: Hashable) -> Node:
-        new_node = Node(key, value)
+        if self.pool:
+            new_node = self.pool.pop()
+            new_node.key = key
+            new_node.value = value
+        else:
+            new_node = Node(key, value)
 
         # Merge new node into the root list
         if self.min_node:
@@ -39,6 +49,14 @@ class FibonacciHeap:
         return new_node
 
 
+    def release(self, node: Node) -> None:
+        # Only for nodes that have already been extracted from the heap
+        node.value = None
+        node.degree = 0
+        node.mark = False
+        self.pool.append(node)
+
+
     def extract_min(self) -> Optional[Node]:
         min_val = self.min_node
         if min_val is None:
@@ -49,7 +67,7 @@ class FibonacciHeap:
         min_val.right.left = min_val.left
 
         # [2] Determine the new root list head (temporarily)
-        if min_val == min_val.right:
+        if min_val is min_val.right:
             # min_val was the only root
             new_root_list_head = None
         else:
@@ -65,7 +83,7 @@ class FibonacciHeap:
             while True:
                 temp.parent = None
                 temp = temp.right
-                if temp == child_list_start:
+                if temp is child_list_start:
                     break
 
             # Merge child list with the new root list
@@ -108,24 +126,14 @@ class FibonacciHeap:
         parent = node.parent
 
         # If heap property is now violated, cut the node from its parent
-        if parent and node.key < parent.key:
+        if parent is not None and new_key < parent.key:
             self._cut(node, parent)
             self._cascading_cut(parent)
 
-        if self.min_node is None or node.key < self.min_node.key:
-            # Check if node is a root (no parent) before assigning
-            if node.parent is None:
-                self.min_node = node            
-            
+        # A node that was not cut has key >= its parent's, so it can only
+        # become the minimum if it is (now) a root
+        if node.parent is None and new_key < self.min_node.key:
             self.min_node = node
-            if parent and node.key < parent.key:
-                self._cut(node, parent)
-                self._cascading_cut(parent)
-
-            if self.min_node is None or node.key < self.min_node.key:
-                # ONLY update if the node is a root
-                if node.parent is None:
-                    self.min_node = node
 
         
     def _consolidate(self) -> None:
@@ -149,7 +157,7 @@ class FibonacciHeap:
         while True:
             current_roots.append(node)
             node = node.right
-            if node == self.min_node:
+            if node is self.min_node:
                 break
         
         for node in current_roots:
@@ -205,12 +213,12 @@ class FibonacciHeap:
 
     def _cut(self, node: Node, parent: Node) -> None:
         # Remove node from its sibling list
-        if node == node.right:
+        if node is node.right:
             parent.child = None
         else:
             node.left.right = node.right
             node.right.left = node.left
-            if parent.child == node:
+            if parent.child is node:
                 parent.child = node.right
 
         parent.degree -= 1
@@ -231,10 +239,54 @@ class FibonacciHeap:
 
 
     def _cascading_cut(self, node: Node) -> None:
+        # Iterative, so long chains of marked ancestors cannot hit the recursion limit
         parent = node.parent
-        if parent:
+        while parent is not None:
             if not node.mark:
                 node.mark = True
-            else:
-                self._cut(node, parent)
-                self._cascading_cut(parent)
+                return
+
+            self._cut(node, parent)
+            node = parent
+            parent = node.parent
+
+
+class CountingFibonacciHeap(FibonacciHeap):
+    """FibonacciHeap that records its operations on a Counters object.
+
+    A subclass rather than checks in FibonacciHeap, so the plain heap pays
+    nothing for instrumentation.
+    """
+
+    def __init__(self, counters) -> None:
+        super().__init__()
+        self.counters = counters
+        self.cascading: bool = False
+
+    def insert(self, key: float, value: Hashable) -> Node:
+        self.counters.pushes += 1
+        return super().insert(key, value)
+
+    def extract_min(self) -> Optional[Node]:
+        self.counters.pops += 1
+        return super().extract_min()
+
+    def decrease_key(self, node: Node, new_key: float) -> None:
+        self.counters.decrease_keys += 1
+        super().decrease_key(node, new_key)
+
+    def _consolidate(self) -> None:
+        self.counters.consolidations += 1
+        super()._consolidate()
+
+    def _cut(self, node: Node, parent: Node) -> None:
+        if self.cascading:
+            self.counters.cascading_cuts += 1
+        super()._cut(node, parent)
+
+    def _cascading_cut(self, node: Node) -> None:
+        self.cascading = True
+        try:
+            super()._cascading_cut(node)
+        finally:
+            self.cascading = False
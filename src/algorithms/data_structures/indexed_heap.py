@@ -0,0 +1,110 @@
+from __future__ import annotations
+from typing import Dict, Hashable, List, Tuple
+
+class IndexedDaryHeap:
+    """Array-backed d-ary min-heap with a position index for O(log n) decrease_key.
+
+    Every value is stored at most once, so the heap never holds more than one
+    entry per vertex (unlike lazy deletion with heapq).
+    """
+
+    def __init__(self, arity: int = 4) -> None:
+        if arity < 2:
+            raise ValueError("Arity must be at least 2.")
+
+        self.arity: int = arity
+        # keys[i] is the priority of values[i]; both lists are in heap order
+        self.keys: List[float] = []
+        self.values: List[Hashable] = []
+        self.position: Dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __contains__(self, value: Hashable) -> bool:
+        return value in self.position
+
+    def key_of(self, value: Hashable) -> float:
+        return self.keys[self.position[value]]
+
+    def insert(self, key: float, value: Hashable) -> None:
+        if value in self.position:
+            raise ValueError("Value is already in the heap.")
+
+        self.keys.append(key)
+        self.values.append(value)
+        self.position[value] = len(self.values) - 1
+        self._sift_up(len(self.values) - 1)
+
+    def peek_min(self) -> Tuple[float, Hashable]:
+        return self.keys[0], self.values[0]
+
+    def extract_min(self) -> Tuple[float, Hashable]:
+        keys, values = self.keys, self.values
+        min_key, min_value = keys[0], values[0]
+        del self.position[min_value]
+
+        last_key, last_value = keys.pop(), values.pop()
+        if values:
+            keys[0] = last_key
+            values[0] = last_value
+            self.position[last_value] = 0
+            self._sift_down(0)
+
+        return min_key, min_value
+
+    def decrease_key(self, value: Hashable, new_key: float) -> None:
+        i = self.position[value]
+        if new_key > self.keys[i]:
+            raise ValueError("New key is greater than the current key.")
+
+        self.keys[i] = new_key
+        self._sift_up(i)
+
+    def _sift_up(self, i: int) -> None:
+        keys, values, position, arity = self.keys, self.values, self.position, self.arity
+        key, value = keys[i], values[i]
+
+        # Move the hole upwards instead of swapping at every level
+        while i > 0:
+            parent = (i - 1) // arity
+            if keys[parent] <= key:
+                break
+            keys[i] = keys[parent]
+            values[i] = values[parent]
+            position[values[i]] = i
+            i = parent
+
+        keys[i] = key
+        values[i] = value
+        position[value] = i
+
+    def _sift_down(self, i: int) -> None:
+        keys, values, position, arity = self.keys, self.values, self.position, self.arity
+        n = len(values)
+        key, value = keys[i], values[i]
+
+        while True:
+            first = arity * i + 1
+            if first >= n:
+                break
+
+            # Pick the smallest of the (up to) arity children
+            best = first
+            best_key = keys[first]
+            for child in range(first + 1, min(first + arity, n)):
+                if keys[child] < best_key:
+                    best = child
+                    best_key = keys[child]
+
+            if key <= best_key:
+                break
+
+            keys[i] = best_key
+            values[i] = values[best]
+            position[values[i]] = i
+            i = best
+
+        keys[i] = key
+        values[i] = value
+        position[value] = i
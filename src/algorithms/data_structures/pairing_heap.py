@@ -0,0 +1,110 @@
+from __future__ import annotations
+from typing import Dict, Hashable, Optional, Tuple
+
+class Node:
+    __slots__ = ('key', 'value', 'child', 'sibling', 'prev')
+
+    def __init__(self, key: float, value: Hashable):
+        self.key: float = key
+        self.value: Hashable = value
+        # leftmost child and right sibling
+        self.child: Optional[Node] = None
+        self.sibling: Optional[Node] = None
+        # parent if this is a leftmost child, left sibling otherwise
+        self.prev: Optional[Node] = None
+
+class PairingHeap:
+    """Pairing heap with the same value-based interface as IndexedDaryHeap."""
+
+    def __init__(self) -> None:
+        self.root: Optional[Node] = None
+        self.nodes: Dict[Hashable, Node] = {}
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __contains__(self, value: Hashable) -> bool:
+        return value in self.nodes
+
+    def key_of(self, value: Hashable) -> float:
+        return self.nodes[value].key
+
+    def insert(self, key: float, value: Hashable) -> None:
+        if value in self.nodes:
+            raise ValueError("Value is already in the heap.")
+
+        node = Node(key, value)
+        self.nodes[value] = node
+        self.root = node if self.root is None else self._meld(self.root, node)
+
+    def peek_min(self) -> Tuple[float, Hashable]:
+        return self.root.key, self.root.value
+
+    def extract_min(self) -> Tuple[float, Hashable]:
+        root = self.root
+        del self.nodes[root.value]
+        self.root = self._merge_pairs(root.child)
+        if self.root is not None:
+            self.root.prev = None
+
+        return root.key, root.value
+
+    def decrease_key(self, value: Hashable, new_key: float) -> None:
+        node = self.nodes[value]
+        if new_key > node.key:
+            raise ValueError("New key is greater than the current key.")
+
+        node.key = new_key
+        if node is self.root:
+            return
+
+        # Detach the subtree rooted at node and meld it back with the root
+        if node.prev.child is node:
+            node.prev.child = node.sibling
+        else:
+            node.prev.sibling = node.sibling
+        if node.sibling is not None:
+            node.sibling.prev = node.prev
+        node.sibling = None
+        node.prev = None
+
+        self.root = self._meld(self.root, node)
+
+    def _meld(self, a: Node, b: Node) -> Node:
+        if b.key < a.key:
+            a, b = b, a
+
+        # b becomes the leftmost child of a
+        b.prev = a
+        b.sibling = a.child
+        if a.child is not None:
+            a.child.prev = b
+        a.child = b
+
+        return a
+
+    def _merge_pairs(self, first: Optional[Node]) -> Optional[Node]:
+        if first is None:
+            return None
+
+        # First pass: meld siblings pairwise from left to right
+        pairs = []
+        node = first
+        while node is not None:
+            a = node
+            b = a.sibling
+            if b is None:
+                a.sibling = a.prev = None
+                pairs.append(a)
+                break
+            node = b.sibling
+            a.sibling = a.prev = None
+            b.sibling = b.prev = None
+            pairs.append(self._meld(a, b))
+
+        # Second pass: meld the pairs from right to left
+        result = pairs.pop()
+        while pairs:
+            result = self._meld(pairs.pop(), result)
+
+        return result
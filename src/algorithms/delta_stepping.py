@@ -0,0 +1,136 @@
+from __future__ import annotations
+from typing import Optional, Tuple
+import numpy as np
+from .data_structures.csr_graph import CSRGraph
+from .dijkstra_csr_bin_heap import to_label_dicts
+
+# Meyer and Sanders' delta-stepping. Vertices are kept in buckets of width
+# delta; a whole bucket is settled at once by relaxing its light edges
+# (weight <= delta) until the bucket stops changing, then its heavy edges
+# once. Each round relaxes the edges of the entire frontier as one batch of
+# NumPy operations instead of one heap operation per edge.
+
+def default_delta(graph: CSRGraph) -> float:
+    # Mean edge weight, a reasonable start for the sweep in tests/delta_stepping.py
+    _, _, weights = graph.as_numpy()
+    return float(weights.mean()) if len(weights) else 1.0
+
+
+def split_edges(graph: CSRGraph, delta: float):
+    """Splits the CSR arrays into a light and a heavy CSR, each as (offsets, targets, weights)."""
+
+    offsets, targets, weights = graph.as_numpy()
+    sources = np.repeat(np.arange(graph.num_nodes, dtype=np.int64), np.diff(offsets))
+
+    parts = []
+    for mask in (weights <= delta, weights > delta):
+        part_offsets = np.zeros(graph.num_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources[mask], minlength=graph.num_nodes), out=part_offsets[1:])
+        parts.append((part_offsets, targets[mask], weights[mask]))
+
+    return parts
+
+
+def gather_edges(frontier: np.ndarray, offsets: np.ndarray, targets: np.ndarray, weights: np.ndarray):
+    # (source, target, weight) of every out-edge of the frontier, without a Python loop
+    starts = offsets[frontier]
+    counts = offsets[frontier + 1] - starts
+    total = int(counts.sum())
+    if total == 0:
+        return None
+
+    edge_ids = np.arange(total, dtype=np.int64) + np.repeat(starts - (np.cumsum(counts) - counts), counts)
+    return np.repeat(frontier, counts), targets[edge_ids], weights[edge_ids]
+
+
+def relax(frontier: np.ndarray, edges, dist: np.ndarray, pred: np.ndarray) -> np.ndarray:
+    """Relaxes the frontier's edges in one batch and returns the vertices that improved."""
+
+    gathered = gather_edges(frontier, *edges)
+    if gathered is None:
+        return frontier[:0]
+
+    sources, targets, weights = gathered
+    candidates = dist[sources] + weights
+
+    # Keep the best candidate per target, then only those that beat dist
+    order = np.lexsort((candidates, targets))
+    targets, candidates, sources = targets[order], candidates[order], sources[order]
+    first = np.ones(len(targets), dtype=bool)
+    first[1:] = targets[1:] != targets[:-1]
+    targets, candidates, sources = targets[first], candidates[first], sources[first]
+
+    improved = candidates < dist[targets]
+    targets = targets[improved]
+    dist[targets] = candidates[improved]
+    pred[targets] = sources[improved]
+
+    return targets
+
+
+def delta_stepping_arrays(graph: CSRGraph, source: int, delta: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+    # Returns (dist, pred) arrays over vertex indices, pred being -1 for no predecessor
+    if delta is None:
+        delta = default_delta(graph)
+    if delta <= 0:
+        raise ValueError("Delta must be positive.")
+
+    light, heavy = split_edges(graph, delta)
+
+    dist = np.full(graph.num_nodes, np.inf)
+    pred = np.full(graph.num_nodes, -1, dtype=np.int64)
+    dist[source] = 0.0
+
+    # Reached vertices whose bucket has not been processed yet, as an index
+    # array, so finding the next bucket costs O(pending) rather than O(V).
+    # queued mirrors it as a mask, to keep vertices out of it twice
+    pending = np.array([source], dtype=np.int64)
+    queued = np.zeros(graph.num_nodes, dtype=bool)
+    queued[source] = True
+
+    def enqueue(improved: np.ndarray) -> np.ndarray:
+        improved = improved[~queued[improved]]
+        queued[improved] = True
+        return improved
+
+    while len(pending):
+        bucket_end = (np.floor(dist[pending].min() / delta) + 1) * delta
+
+        in_bucket = dist[pending] < bucket_end
+        frontier = pending[in_bucket]
+        pending = pending[~in_bucket]
+        queued[frontier] = False
+        settled = [frontier]
+        later = [pending]
+
+        # Light edges can put vertices back into the current bucket
+        while len(frontier):
+            improved = relax(frontier, light, dist, pred)
+
+            in_bucket = dist[improved] < bucket_end
+            frontier = improved[in_bucket]
+            queued[frontier] = False
+            settled.append(frontier)
+            later.append(enqueue(improved[~in_bucket]))
+
+        # Heavy edges always land in a later bucket, so one pass is enough
+        improved = relax(np.unique(np.concatenate(settled)), heavy, dist, pred)
+        later.append(enqueue(improved))
+
+        # Drops the vertices that light edges pulled into this bucket
+        pending = np.concatenate(later)
+        pending = pending[queued[pending]]
+
+    return dist, pred
+
+
+def delta_stepping(graph, start_node, delta: Optional[float] = None):
+    if not isinstance(graph, CSRGraph):
+        graph = CSRGraph.from_networkx(graph)
+
+    if start_node not in graph.index:
+        raise ValueError("Source node is not in the graph.")
+
+    dist, pred = delta_stepping_arrays(graph, graph.index[start_node], delta)
+
+    return to_label_dicts(graph, dist.tolist(), pred.tolist())
@@ -1,6 +1,8 @@
 import heapq
 
-def dijkstra_binary_heap(graph, start_node):
+def dijkstra_binary_heap(graph, start_node, counters=None, on_settle=None):
+    # counters and on_settle are optional, see algorithms/instrumentation.py
+    instrumented = counters is not None or on_settle is not None
     distances = {node: float('inf') for node in graph.nodes()}
     predecessors = {node: [] for node in graph.nodes()}
     distances[start_node] = 0
@@ -10,8 +12,17 @@ def dijkstra_binary_heap(graph, start_node):
         current_distance, current_node = heapq.heappop(pq)
 
         if current_distance > distances[current_node]:
+            if counters is not None:
+                counters.stale_pops += 1
             continue
 
+        if instrumented:
+            if counters is not None:
+                counters.settled += 1
+                counters.relaxations += len(graph.adj[current_node])
+            if on_settle is not None:
+                on_settle(current_node, current_distance)
+
         for neighbor in graph.neighbors(current_node):
             weight = graph[current_node][neighbor]['weight']
             new_distance = distances[current_node] + weight
@@ -21,4 +32,9 @@ def dijkstra_binary_heap(graph, start_node):
                 predecessors[neighbor] = [current_node]
                 heapq.heappush(pq, (new_distance, neighbor))
 
+    if counters is not None:
+        # The heap is drained, so every pushed entry has been popped
+        counters.pops += counters.settled + counters.stale_pops
+        counters.pushes += counters.settled + counters.stale_pops
+
     return distances, predecessors
@@ -0,0 +1,67 @@
+import math
+import numbers
+from typing import Literal, Optional
+from .data_structures.bucket_queue import DialQueue, RadixHeap
+from .dijkstra_adj_list_bin_heap import dijkstra_binary_heap
+
+# Dial needs one bucket per possible weight, beyond this the radix heap is used
+DIAL_MAX_WEIGHT = 1 << 16
+
+def integer_weight_bound(graph) -> Optional[int]:
+    """Largest edge weight if every weight is a non-negative integer, else None."""
+
+    max_weight = 0
+    for _, _, weight in graph.edges(data='weight'):
+        # None (no weight) or anything that is not a number
+        if not isinstance(weight, numbers.Real):
+            return None
+
+        # inf and NaN fail isfinite, so they fall back to the heap too
+        if not math.isfinite(weight) or weight < 0 or not float(weight).is_integer():
+            return None
+        if weight > max_weight:
+            max_weight = weight
+
+    return int(max_weight)
+
+
+def choose_queue(max_weight: Optional[int]) -> Literal["dial", "radix", "heap"]:
+    if max_weight is None:
+        return "heap"
+
+    return "dial" if max_weight <= DIAL_MAX_WEIGHT else "radix"
+
+
+def dijkstra_bucket_queue(graph, start_node, queue: Literal["auto", "dial", "radix", "heap"] = "auto"):
+    max_weight = integer_weight_bound(graph) if queue != "heap" else None
+    if queue == "auto":
+        queue = choose_queue(max_weight)
+    elif queue != "heap" and max_weight is None:
+        raise ValueError("Bucket queues need non-negative integer weights.")
+
+    # Fractional weights: fall back to the comparison heap
+    if queue == "heap":
+        return dijkstra_binary_heap(graph, start_node)
+
+    pq = DialQueue(max_weight) if queue == "dial" else RadixHeap()
+
+    distances = {node: float('inf') for node in graph.nodes()}
+    predecessors = {node: [] for node in graph.nodes()}
+    distances[start_node] = 0
+    pq.push(0, start_node)
+
+    while len(pq):
+        current_distance, current_node = pq.pop()
+
+        if current_distance > distances[current_node]:
+            continue
+
+        for neighbor, edge_data in graph.adj[current_node].items():
+            new_distance = current_distance + edge_data['weight']
+
+            if new_distance < distances[neighbor]:
+                distances[neighbor] = new_distance
+                predecessors[neighbor] = [current_node]
+                pq.push(new_distance, neighbor)
+
+    return distances, predecessors
@@ -1,36 +1,42 @@
 from .data_structures import fib_heap
 import math
 
-def dijkstra_fibonacci_heap(graph, start_node):
-    distances = {}
-    predecessors = {}
+def dijkstra_fibonacci_heap(graph, start_node, pq=None, counters=None, on_settle=None):
+    # counters and on_settle are optional, see algorithms/instrumentation.py
+    instrumented = counters is not None or on_settle is not None
+    distances = {node: math.inf for node in graph.nodes()}
+    predecessors = {node: None for node in graph.nodes()}
     
     # heap_nodes maps graph vertices to their corresponding Node objects
     # in the Fibonacci heap. This is crucial for decrease_key.
+    # Vertices are only inserted once they are first reached, and dropped
+    # again when they are extracted.
     heap_nodes = {}
     
-    pq = fib_heap.FibonacciHeap()
+    # Passing the same (empty) heap to repeated queries lets them reuse its node pool
+    if pq is None:
+        pq = fib_heap.FibonacciHeap() if counters is None else fib_heap.CountingFibonacciHeap(counters)
+    elif pq.total_nodes > 0:
+        raise ValueError("The heap passed in must be empty.")
 
-    for node in graph.nodes():
-        if node == start_node:
-            distances[node] = 0.0
-            heap_nodes[node] = pq.insert(0.0, node)
-        else:
-            distances[node] = math.inf
-            heap_nodes[node] = pq.insert(math.inf, node)
-
-        predecessors[node] = None
+    distances[start_node] = 0.0
+    heap_nodes[start_node] = pq.insert(0.0, start_node)
 
     while pq.total_nodes > 0:
         min_heap_node = pq.extract_min()
-        if min_heap_node is None:
-            break # Heap is empty
 
         u = min_heap_node.value
         u_dist = min_heap_node.key
 
-        if u_dist == math.inf:
-            break
+        del heap_nodes[u]
+        pq.release(min_heap_node)
+
+        if instrumented:
+            if counters is not None:
+                counters.settled += 1
+                counters.relaxations += len(graph[u])
+            if on_settle is not None:
+                on_settle(u, u_dist)
 
         # Relax all edges outgoing from u
         for v, edge_data in graph[u].items():
@@ -44,8 +50,11 @@ def dijkstra_fibonacci_heap(graph, start_node):
                 distances[v] = new_dist
                 predecessors[v] = u
 
-                # Update v's priority in the Fibonacci heap
-                v_heap_node = heap_nodes[v]
-                pq.decrease_key(v_heap_node, new_dist)
+                # Insert v on first reach, otherwise update its priority
+                v_heap_node = heap_nodes.get(v)
+                if v_heap_node is None:
+                    heap_nodes[v] = pq.insert(new_dist, v)
+                else:
+                    pq.decrease_key(v_heap_node, new_dist)
 
     return distances, predecessors
\ No newline at end of file
@@ -0,0 +1,29 @@
+from typing import Literal
+from .data_structures.indexed_heap import IndexedDaryHeap
+from .data_structures.pairing_heap import PairingHeap
+
+def dijkstra_indexed_heap(graph, start_node, heap: Literal["dary", "pairing"] = "dary", arity: int = 4):
+    distances = {node: float('inf') for node in graph.nodes()}
+    predecessors = {node: [] for node in graph.nodes()}
+    distances[start_node] = 0
+
+    pq = IndexedDaryHeap(arity) if heap == "dary" else PairingHeap()
+    pq.insert(0, start_node)
+
+    # Vertices enter the heap when first reached and leave it exactly once,
+    # so it never holds more than V entries and there are no stale pops
+    while len(pq):
+        current_distance, current_node = pq.extract_min()
+
+        for neighbor, edge_data in graph.adj[current_node].items():
+            new_distance = current_distance + edge_data['weight']
+
+            if new_distance < distances[neighbor]:
+                if neighbor in pq:
+                    pq.decrease_key(neighbor, new_distance)
+                else:
+                    pq.insert(new_distance, neighbor)
+                distances[neighbor] = new_distance
+                predecessors[neighbor] = [current_node]
+
+    return distances, predecessors
@@ -1,6 +1,10 @@
 import math
+import numpy as np
+from .data_structures.csr_graph import CSRGraph
 
-def dijkstra_adj_matrix(G, source_node):
+def dijkstra_adj_matrix(G, source_node, counters=None, on_settle=None):
+    # counters and on_settle are optional, see algorithms/instrumentation.py
+    instrumented = counters is not None or on_settle is not None
     nodes = list(G.nodes())
     V = len(nodes)
 
@@ -8,13 +12,14 @@ def dijkstra_adj_matrix(G, source_node):
         raise ValueError("Source node is not in the graph.")
 
     node_to_index = {node: i for i, node in enumerate(nodes)}
-    adj_matrix = [[0 for _ in range(V)] for _ in range(V)]
+    # Missing edges are inf, so weight-0 edges are edges like any other
+    adj_matrix = [[math.inf for _ in range(V)] for _ in range(V)]
 
     for u, neighbors in G.adj.items():
         u_index = node_to_index[u]
         for v, edge_data in neighbors.items():
             v_index = node_to_index[v]
-            adj_matrix[u_index][v_index] = edge_data.get('weight', 1)
+            adj_matrix[u_index][v_index] = min(adj_matrix[u_index][v_index], edge_data.get('weight', 1))
 
     source_index = node_to_index[source_node]
 
@@ -38,10 +43,19 @@ def dijkstra_adj_matrix(G, source_node):
 
         visited[u] = True
 
+        if instrumented:
+            if counters is not None:
+                # Selecting u scans every vertex, relaxing scans u's whole row
+                counters.settled += 1
+                counters.pops += 1
+                counters.relaxations += V
+            if on_settle is not None:
+                on_settle(nodes[u], dist[u])
+
         for v in range(V):
             edge_weight = adj_matrix[u][v]
 
-            if not visited[v] and edge_weight > 0 and dist[u] != math.inf and dist[u] + edge_weight < dist[v]:
+            if not visited[v] and edge_weight != math.inf and dist[u] != math.inf and dist[u] + edge_weight < dist[v]:
 
                 dist[v] = dist[u] + edge_weight
                 predecessors[v] = u
@@ -60,3 +74,58 @@ def dijkstra_adj_matrix(G, source_node):
             final_predecessors[node_label] = []
 
     return final_distances, final_predecessors
+
+
+def dijkstra_adj_matrix_numpy(G, source_node):
+    csr = G if isinstance(G, CSRGraph) else CSRGraph.from_networkx(G)
+    nodes = csr.labels
+    V = csr.num_nodes
+
+    if source_node not in csr.index:
+        raise ValueError("Source node is not in the graph.")
+
+    # Missing edges are inf so that they never win a relaxation, as in
+    # dijkstra_adj_matrix; of parallel edges (CSR allows them) the lightest is kept
+    offsets, targets, weights = csr.as_numpy()
+    sources = np.repeat(np.arange(V), np.diff(offsets))
+    adj_matrix = np.full((V, V), np.inf)
+    adj_matrix[sources, targets] = weights
+    # A plain assignment keeps an arbitrary one of the parallel edges, so
+    # the lighter ones it overwrote are folded in with the (slower) minimum.at
+    lighter = weights < adj_matrix[sources, targets]
+    np.minimum.at(adj_matrix, (sources[lighter], targets[lighter]), weights[lighter])
+
+    source_index = csr.index[source_node]
+
+    dist = np.full(V, np.inf)
+    # Same as dist, except settled vertices are masked out with inf
+    frontier = np.full(V, np.inf)
+    predecessors = np.full(V, -1, dtype=np.int64)
+
+    dist[source_index] = 0
+    frontier[source_index] = 0
+
+    for _ in range(V):
+        u = int(np.argmin(frontier))
+        if frontier[u] == np.inf:
+            break
+
+        frontier[u] = np.inf
+
+        # Settled vertices already have dist <= dist[u], so they are never improved
+        candidates = dist[u] + adj_matrix[u]
+        improved = candidates < dist
+        predecessors[improved] = u
+        np.minimum(dist, candidates, out=dist)
+        frontier[improved] = dist[improved]
+
+    final_distances = dict(zip(nodes, dist.tolist()))
+    final_predecessors = {}
+
+    for i, pred_index in enumerate(predecessors.tolist()):
+        if pred_index >= 0:
+            final_predecessors[nodes[i]] = [nodes[pred_index]]
+        else:
+            final_predecessors[nodes[i]] = []
+
+    return final_distances, final_predecessors
@@ -0,0 +1,49 @@
+import heapq
+from .data_structures.csr_graph import CSRGraph
+
+def dijkstra_csr_arrays(graph: CSRGraph, source: int):
+    # Works purely on vertex indices and returns (dist, pred) lists, pred being -1 for no predecessor
+    V = graph.num_nodes
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+
+    dist = [float('inf')] * V
+    pred = [-1] * V
+    dist[source] = 0
+    pq = [(0, source)]
+
+    while pq:
+        current_distance, u = heapq.heappop(pq)
+
+        if current_distance > dist[u]:
+            continue
+
+        lo, hi = offsets[u], offsets[u + 1]
+        for v, weight in zip(targets[lo:hi], weights[lo:hi]):
+            new_distance = current_distance + weight
+
+            if new_distance < dist[v]:
+                dist[v] = new_distance
+                pred[v] = u
+                heapq.heappush(pq, (new_distance, v))
+
+    return dist, pred
+
+
+def to_label_dicts(graph: CSRGraph, dist, pred):
+    labels = graph.labels
+    distances = dict(zip(labels, dist))
+    predecessors = {labels[i]: ([labels[p]] if p >= 0 else []) for i, p in enumerate(pred)}
+
+    return distances, predecessors
+
+
+def dijkstra_csr_binary_heap(graph, start_node):
+    if not isinstance(graph, CSRGraph):
+        graph = CSRGraph.from_networkx(graph)
+
+    if start_node not in graph.index:
+        raise ValueError("Source node is not in the graph.")
+
+    dist, pred = dijkstra_csr_arrays(graph, graph.index[start_node])
+
+    return to_label_dicts(graph, dist, pred)
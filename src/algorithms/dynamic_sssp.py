@@ -0,0 +1,148 @@
+from __future__ import annotations
+import heapq
+import math
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+from .dijkstra_adj_list_bin_heap import dijkstra_binary_heap
+
+class DynamicSSSP:
+    """Keeps a single-source shortest path tree up to date under edge updates.
+
+    Updates are applied to the graph itself and then repaired locally, in the
+    spirit of Ramalingam and Reps: decreases propagate outwards from the
+    improved vertex, increases and deletions of tree edges only recompute the
+    subtree that hung below the edge. distances and predecessors have the same
+    shape as dijkstra_binary_heap's output.
+    """
+
+    def __init__(self, graph, source: Hashable, distances: Optional[dict] = None, predecessors: Optional[dict] = None) -> None:
+        if distances is None or predecessors is None:
+            distances, predecessors = dijkstra_binary_heap(graph, source)
+
+        self.graph = graph
+        self.source = source
+        self.distances: Dict[Hashable, float] = dict(distances)
+        # Accept both [u]/[] lists and u/None scalars for predecessors
+        self.predecessors: Dict[Hashable, List[Hashable]] = {}
+        self.children: Dict[Hashable, Set[Hashable]] = {node: set() for node in graph.nodes()}
+        for node, preds in predecessors.items():
+            if not isinstance(preds, list):
+                preds = [] if preds is None else [preds]
+            self.predecessors[node] = preds[:1]
+            if preds:
+                self.children[preds[0]].add(node)
+
+    def _in_edges(self, node):
+        adj = self.graph.pred if self.graph.is_directed() else self.graph.adj
+        return adj[node].items()
+
+    def _set_parent(self, node, parent) -> None:
+        old = self.predecessors.get(node)
+        if old:
+            self.children[old[0]].discard(node)
+        if parent is None:
+            self.predecessors[node] = []
+        else:
+            self.predecessors[node] = [parent]
+            self.children[parent].add(node)
+
+    def _directions(self, u, v) -> List[Tuple[Hashable, Hashable]]:
+        return [(u, v)] if self.graph.is_directed() else [(u, v), (v, u)]
+
+    def set_edge_weight(self, u: Hashable, v: Hashable, weight: float) -> None:
+        """Inserts the edge u -> v or changes its weight."""
+
+        for node in (u, v):
+            if node not in self.graph:
+                self.graph.add_node(node)
+                self.distances[node] = math.inf
+                self.predecessors[node] = []
+                self.children[node] = set()
+
+        old_weight = self.graph[u][v].get('weight', 1) if self.graph.has_edge(u, v) else math.inf
+        self.graph.add_edge(u, v, weight=weight)
+
+        if weight < old_weight:
+            self._decrease(self._directions(u, v), weight)
+        elif weight > old_weight:
+            self._increase(self._directions(u, v))
+
+    insert_edge = set_edge_weight
+
+    def delete_edge(self, u: Hashable, v: Hashable) -> None:
+        self.graph.remove_edge(u, v)
+        self._increase(self._directions(u, v))
+
+    def apply(self, updates: Iterable[Tuple[Hashable, Hashable, Optional[float]]]) -> None:
+        """Applies (u, v, weight) updates in order, a weight of None deletes the edge."""
+
+        for u, v, weight in updates:
+            if weight is None:
+                self.delete_edge(u, v)
+            else:
+                self.set_edge_weight(u, v, weight)
+
+    def _decrease(self, directions, weight: float) -> None:
+        pq = []
+        for a, b in directions:
+            new_distance = self.distances[a] + weight
+            if new_distance < self.distances[b]:
+                self.distances[b] = new_distance
+                self._set_parent(b, a)
+                pq.append((new_distance, b))
+
+        heapq.heapify(pq)
+        self._propagate(pq)
+
+    def _increase(self, directions) -> None:
+        # Only a tree edge can lengthen shortest paths, and only in its subtree
+        affected: Set[Hashable] = set()
+        for a, b in directions:
+            if self.predecessors[b] == [a]:
+                stack = [b]
+                while stack:
+                    node = stack.pop()
+                    if node not in affected:
+                        affected.add(node)
+                        stack.extend(self.children[node])
+
+        if not affected:
+            return
+
+        for node in affected:
+            self.distances[node] = math.inf
+            self._set_parent(node, None)
+
+        # Seed each affected vertex with its best edge from the unaffected part
+        pq = []
+        for node in affected:
+            best, best_parent = math.inf, None
+            for parent, edge_data in self._in_edges(node):
+                if parent in affected:
+                    continue
+                candidate = self.distances[parent] + edge_data.get('weight', 1)
+                if candidate < best:
+                    best, best_parent = candidate, parent
+
+            if best_parent is not None:
+                self.distances[node] = best
+                self._set_parent(node, best_parent)
+                pq.append((best, node))
+
+        heapq.heapify(pq)
+        self._propagate(pq)
+
+    def _propagate(self, pq) -> None:
+        distances = self.distances
+        adj = self.graph.adj
+
+        while pq:
+            current_distance, current_node = heapq.heappop(pq)
+            if current_distance > distances[current_node]:
+                continue
+
+            for neighbor, edge_data in adj[current_node].items():
+                new_distance = current_distance + edge_data.get('weight', 1)
+                if new_distance < distances[neighbor]:
+                    distances[neighbor] = new_distance
+                    self._set_parent(neighbor, current_node)
+                    heapq.heappush(pq, (new_distance, neighbor))
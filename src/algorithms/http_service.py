@@ -0,0 +1,253 @@
+from __future__ import annotations
+import asyncio
+import bisect
+import json
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from http import HTTPStatus
+from typing import Dict, Hashable, Literal, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+from .batch import _init_worker, _solve, default_context
+from .cache import LRUCache
+from .data_structures.csr_graph import CSRGraph
+from .query_service import json_distance
+from .sssp_result import SSSPResult
+
+def make_executor(graphs: Dict[str, CSRGraph], pool: Literal["process", "thread"] = "process", max_workers: Optional[int] = None) -> Executor:
+    if pool == "thread":
+        _init_worker(graphs)
+        return ThreadPoolExecutor(max_workers=max_workers)
+
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=default_context(), initializer=_init_worker, initargs=(graphs,))
+
+
+class LatencyHistogram:
+    # Bucket upper bounds in milliseconds, plus one open-ended bucket
+    BOUNDS = (0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(self.BOUNDS) + 1)
+        self.count: int = 0
+        self.total: float = 0.0
+        self.max: float = 0.0
+
+    def observe(self, seconds: float) -> None:
+        ms = seconds * 1000
+        self.counts[bisect.bisect_left(self.BOUNDS, ms)] += 1
+        self.count += 1
+        self.total += ms
+        self.max = max(self.max, ms)
+
+    def as_dict(self) -> dict:
+        buckets = {f"<={bound}": count for bound, count in zip(self.BOUNDS, self.counts)}
+        buckets[f">{self.BOUNDS[-1]}"] = self.counts[-1]
+
+        return {
+            "count": self.count,
+            "mean_ms": self.total / self.count if self.count else 0.0,
+            "max_ms": self.max,
+            "buckets_ms": buckets,
+        }
+
+
+class HTTPError(Exception):
+    def __init__(self, status: HTTPStatus, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+def resolve_label(graph: CSRGraph, raw: str) -> Hashable:
+    # Query strings are text: try the label as-is, then as a JSON scalar (Dhaka has int labels)
+    if raw in graph.index:
+        return raw
+
+    try:
+        value = json.loads(raw)
+    except ValueError:
+        return raw
+
+    return value if isinstance(value, (int, float, str)) else raw
+
+
+class QueryServer:
+    """Serves distance, path and tree queries over HTTP from resident CSR graphs.
+
+    GET /distance?dataset=dhaka&source=1&target=2
+    GET /path?dataset=dhaka&source=1&target=2
+    GET /tree?dataset=dhaka&source=1
+    GET /stats
+
+    The SSSP runs happen on the executor, never on the event loop. Concurrent
+    requests for the same (dataset, source) share one run, and the last
+    cache_size trees are kept.
+    """
+
+    endpoints = ("distance", "path", "tree", "stats")
+
+    def __init__(self, graphs: Dict[str, CSRGraph], executor: Executor, cache_size: int = 64) -> None:
+        self.graphs = graphs
+        self.executor = executor
+        self.trees = LRUCache(max_entries=cache_size)
+        self.inflight: Dict[Tuple[str, int], asyncio.Task] = {}
+        self.histograms: Dict[str, LatencyHistogram] = {endpoint: LatencyHistogram() for endpoint in self.endpoints}
+        self.computed: int = 0
+        self.coalesced: int = 0
+
+    async def tree(self, dataset: str, source: Hashable) -> SSSPResult:
+        graph = self.graphs.get(dataset)
+        if graph is None:
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"Unknown dataset {dataset!r}")
+        if source not in graph.index:
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"Unknown node {source!r}")
+
+        key = (dataset, graph.index[source])
+        result = self.trees.get(key)
+        if result is not None:
+            return result
+
+        task = self.inflight.get(key)
+        if task is None:
+            task = self.inflight[key] = asyncio.ensure_future(self._compute(key))
+        else:
+            self.coalesced += 1
+
+        # Shielded, so a client hanging up does not cancel the run for the others
+        return await asyncio.shield(task)
+
+    async def _compute(self, key: Tuple[str, int]) -> SSSPResult:
+        dataset, source = key
+        try:
+            _, dist, pred = await asyncio.get_running_loop().run_in_executor(self.executor, _solve, source, dataset)
+        finally:
+            del self.inflight[key]
+
+        self.computed += 1
+        graph = self.graphs[dataset]
+        result = SSSPResult(graph.labels, dist, pred, source, graph.index)
+
+        self.trees.put(key, result, result.nbytes())
+
+        return result
+
+    async def dispatch(self, method: str, target: str) -> Tuple[HTTPStatus, dict]:
+        url = urlsplit(target)
+        endpoint = url.path.strip("/")
+        params = {name: values[0] for name, values in parse_qs(url.query).items()}
+
+        if method != "GET":
+            raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED, "Only GET is supported")
+        if endpoint not in self.endpoints:
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"Unknown endpoint {url.path!r}")
+
+        if endpoint == "stats":
+            return HTTPStatus.OK, self.stats()
+
+        required = ("dataset", "source") if endpoint == "tree" else ("dataset", "source", "target")
+        missing = [name for name in required if name not in params]
+        if missing:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"Missing parameters: {', '.join(missing)}")
+
+        dataset = params["dataset"]
+        if dataset not in self.graphs:
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"Unknown dataset {dataset!r}")
+
+        source = resolve_label(self.graphs[dataset], params["source"])
+        result = await self.tree(dataset, source)
+        response = {"dataset": dataset, "source": source}
+
+        if endpoint == "tree":
+            response["edges"] = [[parent, child, distance] for parent, child, distance in result.tree_edges()]
+            return HTTPStatus.OK, response
+
+        target = resolve_label(self.graphs[dataset], params["target"])
+        if target not in result.index:
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"Unknown node {target!r}")
+
+        response["target"] = target
+        response["distance"] = json_distance(result.distance_to(target))
+        if endpoint == "path":
+            response["path"] = result.path_to(target) if response["distance"] is not None else None
+
+        return HTTPStatus.OK, response
+
+    def stats(self) -> dict:
+        return {
+            "latency": {endpoint: histogram.as_dict() for endpoint, histogram in self.histograms.items()},
+            "computed": self.computed,
+            "coalesced": self.coalesced,
+            "cache_hits": self.trees.hits,
+            "inflight": len(self.inflight),
+        }
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        # Minimal HTTP/1.1: GET only, keep-alive unless the client asks to close
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if not line.strip():
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                if int(headers.get("content-length", 0)):
+                    await reader.readexactly(int(headers["content-length"]))
+
+                start = time.perf_counter()
+                parts = request_line.decode("latin-1").split()
+                version = parts[2] if len(parts) == 3 else "HTTP/1.0"
+                endpoint = None
+                try:
+                    if len(parts) != 3:
+                        raise HTTPError(HTTPStatus.BAD_REQUEST, "Malformed request line")
+                    endpoint = urlsplit(parts[1]).path.strip("/")
+                    status, body = await self.dispatch(parts[0], parts[1])
+                except HTTPError as e:
+                    status, body = e.status, {"error": str(e)}
+                except Exception as e:
+                    # e.g. a worker process died; report it rather than dropping the connection
+                    status, body = HTTPStatus.INTERNAL_SERVER_ERROR, {"error": f"{type(e).__name__}: {e}"}
+
+                keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                payload = json.dumps(body).encode()
+                writer.write(
+                    f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                    f"Content-Type: application/json\r\n"
+                    f"Content-Length: {len(payload)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + payload
+                )
+                await writer.drain()
+
+                if endpoint in self.histograms:
+                    self.histograms[endpoint].observe(time.perf_counter() - start)
+
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8000) -> asyncio.Server:
+        return await asyncio.start_server(self.handle, host, port)
+
+
+def serve(graphs: Dict[str, CSRGraph], host: str = "127.0.0.1", port: int = 8000, pool: Literal["process", "thread"] = "process", max_workers: Optional[int] = None, cache_size: int = 64) -> None:
+    """Runs the server until interrupted."""
+
+    async def main():
+        server = await QueryServer(graphs, executor, cache_size).start(host, port)
+        print(f"Serving {', '.join(graphs)} on http://{host}:{server.sockets[0].getsockname()[1]}")
+        async with server:
+            await server.serve_forever()
+
+    executor = make_executor(graphs, pool, max_workers)
+    try:
+        asyncio.run(main())
+    finally:
+        executor.shutdown(cancel_futures=True)
@@ -0,0 +1,143 @@
+from __future__ import annotations
+import time
+from array import array
+from typing import Callable, Dict, Hashable, Iterator, List, NamedTuple, Optional, Tuple
+import numpy as np
+from .data_structures.csr_graph import CSRGraph
+
+class EdgeListFormat(NamedTuple):
+    delimiter: str
+    has_header: bool
+    source_column: int
+    target_column: int
+    # None means every edge has weight 1
+    weight_column: Optional[int]
+    directed: bool
+
+
+# The raw edge lists shipped in data/real_world
+formats: Dict[str, EdgeListFormat] = {
+    # XCoord,YCoord,START_NODE,END_NODE,EDGE,LENGTH
+    "dhaka_csv": EdgeListFormat(",", True, 2, 3, 5, True),
+    # Source<TAB>Target<TAB>Weight
+    "dhaka_tsv": EdgeListFormat("\t", True, 0, 1, 2, True),
+    # node_1,node_2
+    "lastfm_csv": EdgeListFormat(",", True, 0, 1, None, False),
+    # header-less u,v pairs
+    "edges": EdgeListFormat(",", False, 0, 1, None, False),
+}
+
+
+class IngestStats:
+    def __init__(self) -> None:
+        self.edges: int = 0
+        self.chunks: int = 0
+        self.bytes: int = 0
+        self.seconds: float = 0.0
+
+    @property
+    def edges_per_second(self) -> float:
+        return self.edges / self.seconds if self.seconds > 0 else 0.0
+
+    def __repr__(self) -> str:
+        return f"IngestStats(edges={self.edges}, chunks={self.chunks}, bytes={self.bytes}, seconds={self.seconds:.3f}, edges_per_second={self.edges_per_second:.0f})"
+
+
+def read_chunks(path: str, chunk_size: int = 1 << 20, stats: Optional[IngestStats] = None) -> Iterator[List[str]]:
+    """Yields the complete lines found in each fixed-size block of the file."""
+
+    remainder = b""
+    with open(path, 'rb') as f:
+        while True:
+            block = f.read(chunk_size)
+            if not block:
+                break
+
+            if stats is not None:
+                stats.bytes += len(block)
+                stats.chunks += 1
+
+            # A line cut at the block boundary is finished by the next block
+            block = remainder + block
+            end = block.rfind(b"\n") + 1
+            remainder = block[end:]
+            if end:
+                yield block[:end].decode().splitlines()
+
+    if remainder:
+        yield remainder.decode().splitlines()
+
+
+def parse_chunks(chunks: Iterator[List[str]], edge_format: EdgeListFormat, intern: Callable[[str], int]) -> Iterator[Tuple[array, array, array]]:
+    """Turns chunks of lines into (sources, targets, weights) arrays of interned ids."""
+
+    delimiter = edge_format.delimiter
+    source_column, target_column, weight_column = edge_format.source_column, edge_format.target_column, edge_format.weight_column
+    skip_header = edge_format.has_header
+
+    for lines in chunks:
+        sources, targets, weights = array('q'), array('q'), array('d')
+        for line in lines:
+            if not line.strip():
+                continue
+            if skip_header:
+                skip_header = False
+                continue
+
+            fields = line.split(delimiter)
+            sources.append(intern(fields[source_column].strip()))
+            targets.append(intern(fields[target_column].strip()))
+            weights.append(float(fields[weight_column]) if weight_column is not None else 1.0)
+
+        yield sources, targets, weights
+
+
+class LabelInterner:
+    """Maps raw labels to dense ids 0..V-1 in order of first appearance."""
+
+    def __init__(self, label_type: Callable[[str], Hashable] = int) -> None:
+        self.label_type = label_type
+        self.ids: Dict[str, int] = {}
+        self.labels: List[Hashable] = []
+
+    def __call__(self, raw: str) -> int:
+        i = self.ids.get(raw)
+        if i is None:
+            i = self.ids[raw] = len(self.labels)
+            self.labels.append(self.label_type(raw))
+        return i
+
+
+def ingest(path: str, edge_format: EdgeListFormat | str, chunk_size: int = 1 << 20, label_type: Callable[[str], Hashable] = int) -> Tuple[CSRGraph, IngestStats]:
+    """Streams an edge list into a CSRGraph.
+
+    Only one chunk of text is alive at a time; edges are kept as flat id and
+    weight arrays (24 bytes per edge) until the CSR arrays are built at the end.
+    """
+
+    if isinstance(edge_format, str):
+        edge_format = formats[edge_format]
+
+    stats = IngestStats()
+    interner = LabelInterner(label_type)
+    sources, targets, weights = array('q'), array('q'), array('d')
+
+    start = time.perf_counter()
+    for chunk_sources, chunk_targets, chunk_weights in parse_chunks(read_chunks(path, chunk_size, stats), edge_format, interner):
+        sources.extend(chunk_sources)
+        targets.extend(chunk_targets)
+        weights.extend(chunk_weights)
+    stats.edges = len(sources)
+
+    if not edge_format.directed:
+        # Add the reverse direction in one go rather than per edge
+        src, tgt = np.frombuffer(sources, dtype=np.int64), np.frombuffer(targets, dtype=np.int64)
+        w = np.frombuffer(weights, dtype=np.float64)
+        sources = array('q', np.concatenate([src, tgt]).tobytes())
+        targets = array('q', np.concatenate([tgt, src]).tobytes())
+        weights = array('d', np.concatenate([w, w]).tobytes())
+
+    graph = CSRGraph.from_coo(sources, targets, weights, interner.labels, edge_format.directed)
+    stats.seconds = time.perf_counter() - start
+
+    return graph, stats
@@ -0,0 +1,34 @@
+from __future__ import annotations
+from typing import Callable, Dict, Hashable, Optional
+
+# Engines take counters=None and on_settle=None. With both left as None they
+# run their usual loop: the checks sit on the per-pop path, never per edge,
+# and the Fibonacci heap only counts when a CountingFibonacciHeap is used.
+
+SettleHook = Callable[[Hashable, float], None]
+
+class Counters:
+    def __init__(self) -> None:
+        self.pushes: int = 0
+        self.pops: int = 0
+        self.stale_pops: int = 0
+        self.decrease_keys: int = 0
+        self.cascading_cuts: int = 0
+        self.consolidations: int = 0
+        self.relaxations: int = 0
+        self.settled: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return dict(vars(self))
+
+    def __repr__(self) -> str:
+        return f"Counters({', '.join(f'{name}={value}' for name, value in vars(self).items())})"
+
+
+def instrumented(engine: Callable, graph, source: Hashable, on_settle: Optional[SettleHook] = None, **kwargs):
+    """Runs engine(graph, source) once with fresh counters and returns (distances, predecessors, counters)."""
+
+    counters = Counters()
+    distances, predecessors = engine(graph, source, counters=counters, on_settle=on_settle, **kwargs)
+
+    return distances, predecessors, counters
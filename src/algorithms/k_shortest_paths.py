@@ -0,0 +1,125 @@
+from __future__ import annotations
+import heapq
+import itertools
+import math
+from typing import Dict, Hashable, Iterator, List, Literal, Set, Tuple
+from .bounded_search import settle_order
+from .shortest_path import frontiers, build_path
+
+# Yen's algorithm. Every spur search is an A* towards the target whose
+# heuristic is the exact distance-to-target tree of the unmodified graph,
+# computed once per query: removing nodes and edges can only make paths
+# longer, so the bound stays admissible and consistent, and most spur
+# searches settle little more than the spur path itself.
+
+def distances_to(graph, target: Hashable) -> Dict[Hashable, float]:
+    # Reverse search from the target, along incoming edges
+    reverse = graph.reverse(copy=False) if graph.is_directed() else graph
+    return {item.node: item.distance for item in settle_order(reverse, target)}
+
+
+def path_cost(graph, path: List[Hashable]) -> float:
+    # Summed edge by edge, so equal paths always get bit-identical costs
+    return sum(graph.adj[u][v].get('weight', 1) for u, v in zip(path, path[1:]))
+
+
+def spur_search(graph, spur: Hashable, target: Hashable, to_target: Dict[Hashable, float], blocked_nodes: Set[Hashable], blocked_edges: Set[Tuple[Hashable, Hashable]], limit: float = math.inf, engine: Literal["binary", "fibonacci"] = "binary") -> Tuple[float, List[Hashable]]:
+    """Shortest spur -> target path avoiding blocked_nodes and blocked_edges.
+
+    Gives up with (inf, []) as soon as nothing shorter than limit can be found.
+    """
+
+    frontier = frontiers[engine]()
+    frontier.push(spur, to_target[spur])
+    distances = {spur: 0}
+    predecessors = {spur: None}
+    settled = set()
+
+    while True:
+        key = frontier.peek_key(settled)
+        if key == math.inf or key >= limit:
+            return math.inf, []
+
+        _, current_node = frontier.pop(settled)
+        settled.add(current_node)
+
+        if current_node == target:
+            return distances[target], build_path(predecessors, target)
+
+        current_distance = distances[current_node]
+        for neighbor, edge_data in graph.adj[current_node].items():
+            if neighbor in settled or neighbor in blocked_nodes or (current_node, neighbor) in blocked_edges:
+                continue
+
+            # Vertices that cannot reach the target at all are never queued
+            remaining = to_target.get(neighbor, math.inf)
+            if remaining == math.inf:
+                continue
+
+            new_distance = current_distance + edge_data.get('weight', 1)
+            if new_distance < distances.get(neighbor, math.inf):
+                distances[neighbor] = new_distance
+                predecessors[neighbor] = current_node
+                frontier.push(neighbor, new_distance + remaining)
+
+
+def k_shortest_paths(graph, source: Hashable, target: Hashable, k: int, engine: Literal["binary", "fibonacci"] = "binary") -> Iterator[Tuple[float, List[Hashable]]]:
+    """Yields up to k loopless (distance, path) pairs from source to target, shortest first.
+
+    Later paths are only computed when the consumer asks for them.
+    """
+
+    if source not in graph or target not in graph:
+        raise ValueError("Source or target node is not in the graph.")
+
+    if engine not in frontiers:
+        raise ValueError(f"Unknown engine {engine!r}, expected one of {list(frontiers)}.")
+
+    if k <= 0:
+        return
+
+    to_target = distances_to(graph, target)
+    if source not in to_target:
+        return
+
+    _, path = spur_search(graph, source, target, to_target, set(), set(), engine=engine)
+    accepted = [path]
+    # (distance, tie-breaker, path), so that paths themselves are never compared
+    candidates: List[Tuple[float, int, List[Hashable]]] = []
+    counter = itertools.count()
+    seen = {tuple(path)}
+    yield path_cost(graph, path), path
+
+    while len(accepted) < k:
+        previous = accepted[-1]
+        needed = k - len(accepted)
+
+        root_cost = 0
+        for i, spur in enumerate(previous[:-1]):
+            root = previous[:i + 1]
+
+            # Only the best `needed` candidates can still be accepted, so a spur
+            # that cannot beat the worst of them is not searched at all
+            limit = math.inf
+            if len(candidates) >= needed:
+                limit = heapq.nsmallest(needed, candidates)[-1][0] - root_cost
+
+            if to_target[spur] < limit:
+                # The edges that the accepted paths sharing this root take out of the spur
+                blocked_edges = {(p[i], p[i + 1]) for p in accepted if len(p) > i + 1 and p[:i + 1] == root}
+                _, spur_path = spur_search(graph, spur, target, to_target, set(root[:-1]), blocked_edges, limit, engine)
+
+                if spur_path:
+                    path = root[:-1] + spur_path
+                    if tuple(path) not in seen:
+                        seen.add(tuple(path))
+                        heapq.heappush(candidates, (path_cost(graph, path), next(counter), path))
+
+            root_cost += graph.adj[spur][previous[i + 1]].get('weight', 1)
+
+        if not candidates:
+            return
+
+        distance, _, path = heapq.heappop(candidates)
+        accepted.append(path)
+        yield distance, path
@@ -0,0 +1,156 @@
+from __future__ import annotations
+import json
+import math
+import queue
+import threading
+import time
+from typing import Callable, Dict, Hashable, IO, Iterator, List, Optional
+from .cache import LRUCache
+from .data_structures.csr_graph import CSRGraph
+from .dijkstra_csr_bin_heap import dijkstra_csr_arrays
+from .sssp_result import SSSPResult
+
+def json_distance(distance: float) -> Optional[float]:
+    # JSON has no infinity, unreachable targets are null
+    return None if distance == math.inf else distance
+
+
+class QueryService:
+    """Answers shortest path queries against one resident CSRGraph.
+
+    A query is a dict with a "source" and either a "target" or a list of
+    "targets", plus an optional "id" that is echoed back. Each source costs
+    one SSSP run; the last cache_size trees are kept, so repeated sources
+    are answered by walking the parent array.
+    """
+
+    def __init__(self, graph: CSRGraph, cache_size: int = 64) -> None:
+        self.graph = graph
+        self.trees = LRUCache(max_entries=cache_size)
+
+    def tree(self, source: Hashable) -> SSSPResult:
+        if source not in self.graph.index:
+            raise KeyError(f"Unknown node {source!r}")
+
+        i = self.graph.index[source]
+        result = self.trees.get(i)
+        if result is None:
+            result = SSSPResult.from_csr(self.graph, *dijkstra_csr_arrays(self.graph, i), i)
+            self.trees.put(i, result, result.nbytes())
+
+        return result
+
+    def answer(self, query: dict) -> dict:
+        return self._answer(query, self.tree)
+
+    def answer_batch(self, queries: List[dict]) -> List[dict]:
+        # Every source of the batch is solved once, even if the LRU is smaller than the batch
+        trees: Dict[Hashable, SSSPResult] = {}
+
+        def tree(source):
+            if source not in trees:
+                trees[source] = self.tree(source)
+            return trees[source]
+
+        return [self._answer(query, tree) for query in queries]
+
+    def _answer(self, query: dict, tree: Callable[[Hashable], SSSPResult]) -> dict:
+        response = {"id": query["id"]} if "id" in query else {}
+        if "source" not in query or ("target" not in query and "targets" not in query):
+            response["error"] = "A query needs a source and a target or targets"
+            return response
+
+        try:
+            result = tree(query["source"])
+
+            if "targets" in query:
+                # One bad label must not cost the caller the other targets of the query
+                distances, unknown = [], []
+                for target in query["targets"]:
+                    try:
+                        distances.append(self._distance(result, target))
+                    except (KeyError, TypeError):
+                        distances.append(None)
+                        unknown.append(target)
+
+                response["distances"] = distances
+                if unknown:
+                    response["unknown_targets"] = unknown
+            else:
+                target = query["target"]
+                response["distance"] = self._distance(result, target)
+                if query.get("path", True):
+                    response["path"] = result.path_to(target) if response["distance"] is not None else None
+        except KeyError as e:
+            response["error"] = e.args[0]
+        except TypeError as e:
+            # e.g. an unhashable source such as a list
+            response["error"] = f"Invalid query: {e}"
+
+        return response
+
+    def _distance(self, result: SSSPResult, target: Hashable):
+        if target not in self.graph.index:
+            raise KeyError(f"Unknown node {target!r}")
+
+        return json_distance(result.distance_to(target))
+
+
+def read_batches(lines: IO[str], batch_size: int = 256, max_wait: float = 0.005) -> Iterator[List[str]]:
+    """Groups input lines into batches of up to batch_size.
+
+    A batch is also cut max_wait seconds after its first line, so a client
+    that sends one query and waits for the answer is never stalled.
+    """
+
+    pending: queue.Queue = queue.Queue()
+
+    def reader():
+        for line in lines:
+            pending.put(line)
+        pending.put(None)
+
+    threading.Thread(target=reader, daemon=True).start()
+
+    while True:
+        line = pending.get()
+        if line is None:
+            return
+
+        batch = [line]
+        deadline = time.monotonic() + max_wait
+        while len(batch) < batch_size:
+            try:
+                line = pending.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                break
+            if line is None:
+                yield batch
+                return
+            batch.append(line)
+
+        yield batch
+
+
+def serve_jsonl(service: QueryService, instream: IO[str], outstream: IO[str], batch_size: int = 256, max_wait: float = 0.005) -> None:
+    """Reads one JSON query per line and writes one JSON response per line, in order."""
+
+    for batch in read_batches(instream, batch_size, max_wait):
+        queries, responses = [], []
+        for line in batch:
+            if not line.strip():
+                continue
+            try:
+                query = json.loads(line)
+                if not isinstance(query, dict):
+                    raise ValueError("A query must be a JSON object")
+                queries.append(query)
+            except ValueError as e:
+                # Answer what was parsed so far, so that the output keeps the input order
+                responses.extend(service.answer_batch(queries))
+                queries = []
+                responses.append({"error": f"Invalid query: {e}"})
+
+        responses.extend(service.answer_batch(queries))
+        outstream.write("".join(json.dumps(response) + "\n" for response in responses))
+        outstream.flush()
@@ -0,0 +1,103 @@
+from __future__ import annotations
+from typing import Optional, Tuple
+import numpy as np
+from .data_structures.csr_graph import CSRGraph
+
+# Connected, weighted G(n, p) graphs built with NumPy only. The same seed
+# always gives the same graph, but not the same graph as the NetworkX based
+# create_arbitrary_graphs in tests/utils.py.
+
+def gnp_edges(n: int, p: float, rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+    """Samples the edges of G(n, p) as (u, v) arrays with u > v.
+
+    Instead of flipping a coin for each of the n(n - 1)/2 vertex pairs, the
+    gaps between consecutive edges are drawn from a geometric distribution
+    (Batagelj and Brandes), so the work is proportional to the edge count.
+    """
+
+    pairs = n * (n - 1) // 2
+    if p <= 0 or pairs == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+    # Draw a few standard deviations more gaps than expected, top up if that was not enough
+    expected = pairs * p
+    chunk = int(expected + 6 * np.sqrt(expected) + 16)
+    positions = []
+    last = -1
+    while last < pairs:
+        gaps = rng.geometric(p, size=chunk)
+        chunk_positions = last + np.cumsum(gaps)
+        positions.append(chunk_positions)
+        last = int(chunk_positions[-1])
+
+    k = np.concatenate(positions)
+    k = k[k < pairs]
+
+    # Pair index k -> (u, v) in the lower triangle, k = u(u - 1)/2 + v
+    u = ((1 + np.sqrt(1 + 8 * k.astype(np.float64))) // 2).astype(np.int64)
+    # Correct float rounding for very large k
+    u -= u * (u - 1) // 2 > k
+    u += (u + 1) * u // 2 <= k
+    v = k - u * (u - 1) // 2
+
+    return u, v
+
+
+def connected_components(n: int, u: np.ndarray, v: np.ndarray) -> np.ndarray:
+    """Component label (its smallest vertex) of every vertex.
+
+    Vectorized union-find: every round hooks each edge's larger root onto the
+    smaller one, then compresses the parent pointers by repeated jumping.
+    """
+
+    parent = np.arange(n, dtype=np.int64)
+    while True:
+        ru, rv = parent[u], parent[v]
+        differ = ru != rv
+        if not differ.any():
+            return parent
+
+        ru, rv = ru[differ], rv[differ]
+        np.minimum.at(parent, np.maximum(ru, rv), np.minimum(ru, rv))
+
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+
+
+def stitch_components(labels: np.ndarray, rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+    """One edge per extra component, joining a random vertex of it to a random vertex of the components before it."""
+
+    order = np.argsort(labels, kind='stable')
+    _, starts, sizes = np.unique(labels[order], return_index=True, return_counts=True)
+    if len(starts) <= 1:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+    # Vertices sorted by component, so the earlier components are order[:starts[i]]
+    members = starts[1:] + rng.integers(0, sizes[1:])
+    earlier = rng.integers(0, starts[1:])
+
+    return order[members], order[earlier]
+
+
+def random_csr_graph(n: int, p: float, w_min: int = 1, w_max: int = 20, seed: Optional[int] = None) -> CSRGraph:
+    """Connected undirected G(n, p) with uniform integer weights in [w_min, w_max]."""
+
+    rng = np.random.default_rng(seed)
+
+    u, v = gnp_edges(n, p, rng)
+    extra_u, extra_v = stitch_components(connected_components(n, u, v), rng)
+    u, v = np.concatenate([u, extra_u]), np.concatenate([v, extra_v])
+
+    weights = rng.integers(w_min, w_max + 1, size=len(u)).astype(np.float64)
+
+    # Both directions, as CSRGraph.from_coo expects for undirected graphs
+    return CSRGraph.from_coo(
+        np.concatenate([u, v]),
+        np.concatenate([v, u]),
+        np.concatenate([weights, weights]),
+        list(range(n)),
+        directed=False,
+    )
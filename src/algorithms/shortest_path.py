@@ -0,0 +1,177 @@
+from __future__ import annotations
+import heapq
+import math
+from typing import Dict, Hashable, List, Literal, Optional, Set, Tuple
+from .data_structures.fib_heap import FibonacciHeap, Node
+
+# Both frontiers only hold tentative distances for vertices that have been
+# reached, so a local query never touches the rest of the graph.
+
+class BinaryHeapFrontier:
+    def __init__(self) -> None:
+        self.heap: List[Tuple[float, Hashable]] = []
+        self.distances: Dict[Hashable, float] = {}
+
+    def push(self, node: Hashable, distance: float) -> None:
+        self.distances[node] = distance
+        heapq.heappush(self.heap, (distance, node))
+
+    def peek_key(self, settled: Set[Hashable]) -> float:
+        heap = self.heap
+        # Any stale entry at the top belongs to an already settled vertex
+        while heap and heap[0][1] in settled:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else math.inf
+
+    def pop(self, settled: Set[Hashable]) -> Tuple[float, Hashable]:
+        self.peek_key(settled)
+        return heapq.heappop(self.heap)
+
+
+class FibonacciHeapFrontier:
+    def __init__(self) -> None:
+        self.heap = FibonacciHeap()
+        self.nodes: Dict[Hashable, Node] = {}
+        self.distances: Dict[Hashable, float] = {}
+
+    def push(self, node: Hashable, distance: float) -> None:
+        self.distances[node] = distance
+        heap_node = self.nodes.get(node)
+        if heap_node is None:
+            self.nodes[node] = self.heap.insert(distance, node)
+        else:
+            self.heap.decrease_key(heap_node, distance)
+
+    def peek_key(self, settled: Set[Hashable]) -> float:
+        min_node = self.heap.min_node
+        return min_node.key if min_node is not None else math.inf
+
+    def pop(self, settled: Set[Hashable]) -> Tuple[float, Hashable]:
+        min_node = self.heap.extract_min()
+        key, node = min_node.key, min_node.value
+        del self.nodes[node]
+        self.heap.release(min_node)
+        return key, node
+
+
+frontiers = {
+    "binary": BinaryHeapFrontier,
+    "fibonacci": FibonacciHeapFrontier,
+}
+
+
+def shortest_path(graph, source, target, engine: Literal["binary", "fibonacci"] = "binary", bidirectional: bool = False) -> Tuple[float, List[Hashable]]:
+    """Returns (distance, path) from source to target, or (inf, []) if target is unreachable."""
+
+    if source not in graph or target not in graph:
+        raise ValueError("Source or target node is not in the graph.")
+
+    if engine not in frontiers:
+        raise ValueError(f"Unknown engine {engine!r}, expected one of {list(frontiers)}.")
+
+    if source == target:
+        return 0, [source]
+
+    if bidirectional:
+        return _bidirectional_search(graph, source, target, frontiers[engine])
+
+    return _unidirectional_search(graph, source, target, frontiers[engine])
+
+
+def _unidirectional_search(graph, source, target, frontier_type):
+    frontier = frontier_type()
+    frontier.push(source, 0)
+    distances = frontier.distances
+    predecessors = {source: None}
+    settled = set()
+
+    while frontier.peek_key(settled) < math.inf:
+        current_distance, current_node = frontier.pop(settled)
+        settled.add(current_node)
+
+        # Early exit: the target's distance is final once it is settled
+        if current_node == target:
+            return current_distance, build_path(predecessors, target)
+
+        for neighbor, edge_data in graph.adj[current_node].items():
+            if neighbor in settled:
+                continue
+
+            new_distance = current_distance + edge_data.get('weight', 1)
+            if new_distance < distances.get(neighbor, math.inf):
+                frontier.push(neighbor, new_distance)
+                predecessors[neighbor] = current_node
+
+    return math.inf, []
+
+
+def _bidirectional_search(graph, source, target, frontier_type):
+    # The reverse search walks incoming edges
+    forward_adj = graph.adj
+    backward_adj = graph.pred if graph.is_directed() else graph.adj
+
+    forward, backward = frontier_type(), frontier_type()
+    forward.push(source, 0)
+    backward.push(target, 0)
+    forward_preds = {source: None}
+    backward_preds = {target: None}
+    forward_settled, backward_settled = set(), set()
+
+    best = math.inf
+    meeting_node: Optional[Hashable] = None
+
+    while True:
+        forward_key = forward.peek_key(forward_settled)
+        backward_key = backward.peek_key(backward_settled)
+
+        # No path through an unsettled vertex can beat the best one found so far
+        if forward_key + backward_key >= best:
+            break
+
+        # Grow whichever frontier is currently closer to its root
+        if forward_key <= backward_key:
+            frontier, other, adj = forward, backward, forward_adj
+            predecessors, settled = forward_preds, forward_settled
+        else:
+            frontier, other, adj = backward, forward, backward_adj
+            predecessors, settled = backward_preds, backward_settled
+
+        current_distance, current_node = frontier.pop(settled)
+        settled.add(current_node)
+
+        for neighbor, edge_data in adj[current_node].items():
+            if neighbor in settled:
+                continue
+
+            new_distance = current_distance + edge_data.get('weight', 1)
+            if new_distance < frontier.distances.get(neighbor, math.inf):
+                frontier.push(neighbor, new_distance)
+                predecessors[neighbor] = current_node
+
+                # The frontiers meet at neighbor
+                other_distance = other.distances.get(neighbor)
+                if other_distance is not None and new_distance + other_distance < best:
+                    best = new_distance + other_distance
+                    meeting_node = neighbor
+
+    if meeting_node is None:
+        return math.inf, []
+
+    path = build_path(forward_preds, meeting_node)
+    node = backward_preds[meeting_node]
+    while node is not None:
+        path.append(node)
+        node = backward_preds[node]
+
+    return best, path
+
+
+def build_path(predecessors, target):
+    path = []
+    node = target
+    while node is not None:
+        path.append(node)
+        node = predecessors[node]
+
+    path.reverse()
+    return path
@@ -0,0 +1,146 @@
+from __future__ import annotations
+import math
+import sys
+from array import array
+from typing import Callable, Dict, Hashable, Iterator, List, Optional, Sequence, Tuple
+import numpy as np
+from .data_structures.csr_graph import CSRGraph
+from .dijkstra_csr_bin_heap import dijkstra_csr_arrays
+
+class SSSPResult:
+    """Single-source shortest path tree stored as two flat arrays.
+
+    dist[i] is the distance to labels[i] and parent[i] the index of its
+    predecessor, -1 for the source and unreachable vertices. Compared with
+    the (distances, predecessors) dicts this costs 16 bytes per vertex, and
+    labels and index can be shared by every result on the same graph.
+    """
+
+    __slots__ = ("labels", "dist", "parent", "source", "_index")
+
+    def __init__(self, labels: Sequence[Hashable], dist: Sequence[float], parent: Sequence[int], source: int, index: Optional[Dict[Hashable, int]] = None) -> None:
+        self.labels = labels
+        self.dist = dist if isinstance(dist, array) else array('d', dist)
+        self.parent = parent if isinstance(parent, array) else array('q', parent)
+        self.source = source
+        self._index = index
+
+    @classmethod
+    def from_csr(cls, graph: CSRGraph, dist: Sequence[float], parent: Sequence[int], source: int) -> SSSPResult:
+        # dist and parent as returned by dijkstra_csr_arrays or delta_stepping_arrays
+        if isinstance(dist, np.ndarray):
+            dist, parent = array('d', dist.astype(np.float64).tobytes()), array('q', parent.astype(np.int64).tobytes())
+        return cls(graph.labels, dist, parent, source, graph.index)
+
+    @classmethod
+    def from_dicts(cls, distances: dict, predecessors: dict, source: Hashable) -> SSSPResult:
+        """Converts an engine's (distances, predecessors) output.
+
+        Accepts both predecessor shapes, [u]/[] lists and u/None scalars.
+        """
+
+        labels = list(distances)
+        index = {label: i for i, label in enumerate(labels)}
+        parent = array('q', bytes(8 * len(labels)))
+        for i, label in enumerate(labels):
+            preds = predecessors.get(label)
+            if isinstance(preds, list):
+                preds = preds[0] if preds else None
+            parent[i] = index[preds] if preds is not None else -1
+
+        return cls(labels, array('d', distances.values()), parent, index[source], index)
+
+    @property
+    def index(self) -> Dict[Hashable, int]:
+        # Only built when a label lookup is needed
+        if self._index is None:
+            self._index = {label: i for i, label in enumerate(self.labels)}
+        return self._index
+
+    @property
+    def source_label(self) -> Hashable:
+        return self.labels[self.source]
+
+    def __len__(self) -> int:
+        return len(self.dist)
+
+    def __contains__(self, label: Hashable) -> bool:
+        i = self.index.get(label)
+        return i is not None and self.dist[i] != math.inf
+
+    def distance_to(self, target: Hashable) -> float:
+        return self.dist[self.index[target]]
+
+    def path_to(self, target: Hashable) -> List[Hashable]:
+        """Labels on the shortest path from the source to target, [] if it is unreachable."""
+
+        i = self.index[target]
+        if self.dist[i] == math.inf:
+            return []
+
+        labels, parent = self.labels, self.parent
+        path = []
+        while i != -1:
+            path.append(labels[i])
+            i = parent[i]
+
+        path.reverse()
+        return path
+
+    def tree_edges(self) -> Iterator[Tuple[Hashable, Hashable, float]]:
+        """Yields (parent, child, distance to child) for every edge of the tree."""
+
+        labels, dist = self.labels, self.dist
+        for i, p in enumerate(self.parent):
+            if p != -1:
+                yield labels[p], labels[i], dist[i]
+
+    __iter__ = tree_edges
+
+    def preorder(self) -> Iterator[Hashable]:
+        """Yields the reachable labels depth-first from the source, parents before children."""
+
+        parent = np.frombuffer(self.parent, dtype=np.int64)
+        # Children of every vertex, grouped with a counting sort over the parent array
+        order = np.argsort(parent, kind='stable')
+        starts = np.searchsorted(parent[order], np.arange(len(parent) + 1))
+        order, starts = order.tolist(), starts.tolist()
+
+        labels = self.labels
+        stack = [self.source]
+        while stack:
+            i = stack.pop()
+            yield labels[i]
+            stack.extend(order[starts[i]:starts[i + 1]])
+
+    def to_dicts(self) -> Tuple[dict, dict]:
+        # Back to dijkstra_binary_heap's output shape
+        labels = self.labels
+        distances = dict(zip(labels, self.dist))
+        predecessors = {label: ([labels[p]] if p != -1 else []) for label, p in zip(labels, self.parent)}
+
+        return distances, predecessors
+
+    def nbytes(self) -> int:
+        # The arrays owned by this result; labels and index may be shared
+        return sys.getsizeof(self.dist) + sys.getsizeof(self.parent)
+
+
+def solve(graph, source: Hashable, engine: Optional[Callable] = None) -> SSSPResult:
+    """Runs any engine that returns (distances, predecessors) and wraps its output.
+
+    Without an engine the CSR binary heap is used, which fills the arrays
+    directly and never builds the dicts.
+    """
+
+    if engine is not None:
+        return SSSPResult.from_dicts(*engine(graph, source), source)
+
+    if not isinstance(graph, CSRGraph):
+        graph = CSRGraph.from_networkx(graph)
+
+    if source not in graph.index:
+        raise ValueError("Source node is not in the graph.")
+
+    dist, pred = dijkstra_csr_arrays(graph, graph.index[source])
+    return SSSPResult.from_csr(graph, dist, pred, graph.index[source])
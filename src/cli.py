@@ -1,24 +1,45 @@
+import argparse
+import importlib
 import time
 import sys
 from utils import Style, clear_screen
-import tests
+
+
+def action(module, dataset):
+    # Menu leaf that imports tests.<module> (and NetworkX, matplotlib, ...) only once it is chosen
+    def run():
+        importlib.import_module(f"tests.{module}").test(dataset=dataset)()
+
+    return run
+
 
 # menu_structure:- nested dict to represent menu structure
 menu_structure = {
     "Test on a real-world dataset": {
-        "Adjacency Matrix + Unordered List implementation": tests.dijkstra_adj_matrix.test(dataset="REAL_WORLD"),
-        "Adjacency List + Binary Heap implementation": tests.dijkstra_adj_list_bin_heap.test(dataset="REAL_WORLD"),
-        "Adjacency List + Fibonacci Heap implementation": tests.dijkstra_adj_list_fib_heap.test(dataset="REAL_WORLD"),
-        "Compare various implementations": tests.comparisons.test(dataset="REAL_WORLD"),
+        "Adjacency Matrix + Unordered List implementation": action("dijkstra_adj_matrix", "REAL_WORLD"),
+        "Adjacency List + Binary Heap implementation": action("dijkstra_adj_list_bin_heap", "REAL_WORLD"),
+        "Adjacency List + Fibonacci Heap implementation": action("dijkstra_adj_list_fib_heap", "REAL_WORLD"),
+        "Compare various implementations": action("comparisons", "REAL_WORLD"),
+        "A* vs Dijkstra on the Dhaka road network": action("astar", "REAL_WORLD"),
+        "Contraction Hierarchies on the Dhaka road network": action("contraction_hierarchy", "REAL_WORLD"),
+        "ALT landmarks on the LastFM and EPA graphs": action("alt", "REAL_WORLD"),
+        "Incremental SSSP under Dhaka road updates": action("dynamic_sssp", "REAL_WORLD"),
+        "Radius and k-nearest queries on the Dhaka road network": action("bounded_search", "REAL_WORLD"),
+        "Shortest path tree cache on the Dhaka road network": action("cache", "REAL_WORLD"),
+        "Convert the datasets to the binary CSR format": action("datasets", "REAL_WORLD"),
     },
     "Test a custom dataset (your dataset should be in tests.txt)": {
-        "Adjacency Matrix + Unordered List implementation": tests.dijkstra_adj_matrix.test(dataset="CUSTOM"),
-        "Adjacency List + Binary Heap implementation": tests.dijkstra_adj_list_bin_heap.test(dataset="CUSTOM"),
-        "Adjacency List + Fibonacci Heap implementation": tests.dijkstra_adj_list_fib_heap.test(dataset="CUSTOM"),
-        "Compare various implementations": tests.comparisons.test(dataset="CUSTOM"),
+        "Adjacency Matrix + Unordered List implementation": action("dijkstra_adj_matrix", "CUSTOM"),
+        "Adjacency List + Binary Heap implementation": action("dijkstra_adj_list_bin_heap", "CUSTOM"),
+        "Adjacency List + Fibonacci Heap implementation": action("dijkstra_adj_list_fib_heap", "CUSTOM"),
+        "Compare various implementations": action("comparisons", "CUSTOM"),
     },
     "Benchmark on our testing datasets": {
-        "Compare various implementations": tests.comparisons.test(dataset="BENCHMARK"),
+        "Compare various implementations": action("comparisons", "BENCHMARK"),
+        "Benchmark suite with regression check": action("benchmark_suite", "BENCHMARK"),
+        "Delta-stepping sweep on the real-world graphs": action("delta_stepping", "BENCHMARK"),
+        "HTTP query service on localhost": action("http_service", "BENCHMARK"),
+        "K shortest paths latency on the Dhaka road network": action("k_shortest_paths", "BENCHMARK"),
     },
     "Exit": sys.exit  # The action for "Exit" is to call sys.exit
 }
@@ -79,7 +100,58 @@ def display_menu(menu, breadcrumbs):
             sys.exit(0)
 
 
+def run_batch(args):
+    # Headless: load the graph once, then answer JSON-lines queries until stdin closes
+    from tests.binary_datasets import dataset_names, load_binary_dataset
+    from algorithms.data_structures.csr_graph import CSRGraph
+    from algorithms.query_service import QueryService, serve_jsonl
+
+    graph = load_binary_dataset(args.dataset) if args.dataset in dataset_names else CSRGraph.load(args.dataset)
+    print(f"Loaded {args.dataset}: {graph.num_nodes} nodes, {graph.num_edges} edges", file=sys.stderr)
+
+    serve_jsonl(QueryService(graph, cache_size=args.cache_size), sys.stdin, sys.stdout, args.batch_size, args.max_wait)
+
+
+def run_server(args):
+    # Serves the datasets over HTTP until interrupted
+    from tests.binary_datasets import dataset_names, load_binary_dataset
+    from algorithms.http_service import serve
+
+    names = args.datasets or dataset_names
+    graphs = {name: load_binary_dataset(name) for name in names}
+
+    try:
+        serve(graphs, args.host, args.port, args.pool, args.workers, args.cache_size)
+    except KeyboardInterrupt:
+        print("\nServer stopped.")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Dijkstra's algorithm playground. Without --batch an interactive menu is shown.")
+    parser.add_argument("--batch", action="store_true", help="answer JSON-lines queries from stdin on stdout instead of showing the menu")
+    parser.add_argument("--dataset", default="dhaka", help="real-world dataset name (dhaka, lastfm, epa) or path to a .csr file")
+    parser.add_argument("--batch-size", type=int, default=256, help="maximum number of queries answered together")
+    parser.add_argument("--max-wait", type=float, default=0.005, help="seconds to wait for a batch to fill up")
+    parser.add_argument("--cache-size", type=int, default=64, help="shortest path trees kept for repeated sources")
+    parser.add_argument("--serve", action="store_true", help="serve distance, path and tree queries over HTTP instead of showing the menu")
+    parser.add_argument("--datasets", nargs="+", help="real-world datasets to serve, all of them by default")
+    parser.add_argument("--host", default="127.0.0.1", help="address the server listens on")
+    parser.add_argument("--port", type=int, default=8000, help="port the server listens on")
+    parser.add_argument("--pool", choices=["process", "thread"], default="process", help="where the Dijkstra runs happen")
+    parser.add_argument("--workers", type=int, default=None, help="pool size, one per CPU by default")
+
+    return parser.parse_args()
+
+
 def main():
+    args = parse_args()
+    if args.batch:
+        run_batch(args)
+        return
+    if args.serve:
+        run_server(args)
+        return
+
     try:
         display_menu(menu_structure, [])
     except KeyboardInterrupt:
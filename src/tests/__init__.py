@@ -1,4 +1,28 @@
-from . import dijkstra_adj_matrix
-from . import dijkstra_adj_list_bin_heap
-from . import dijkstra_adj_list_fib_heap
-from . import comparisons
\ No newline at end of file
+import importlib
+
+# Test modules are imported on first access (tests.comparisons, ...) so that
+# importing the package does not pull in NetworkX and matplotlib
+modules = [
+    "dijkstra_adj_matrix",
+    "dijkstra_adj_list_bin_heap",
+    "dijkstra_adj_list_fib_heap",
+    "comparisons",
+    "astar",
+    "contraction_hierarchy",
+    "alt",
+    "dynamic_sssp",
+    "datasets",
+    "benchmark_suite",
+    "delta_stepping",
+    "http_service",
+    "bounded_search",
+    "k_shortest_paths",
+    "cache",
+]
+
+
+def __getattr__(name):
+    if name in modules:
+        return importlib.import_module(f"{__name__}.{name}")
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
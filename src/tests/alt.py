@@ -0,0 +1,62 @@
+from typing import Literal
+import random
+import timeit
+from .utils import load_lastfm_graph, load_epa_graph
+from algorithms import astar
+from algorithms.alt import LandmarkOracle
+
+def custom():
+    pass
+
+
+def real_world():
+    number_of_landmarks = 8
+    number_of_queries = 100
+
+    for name, loader in [("LastFM Asia", load_lastfm_graph), ("EPA Web", load_epa_graph)]:
+        print(f"Loading the {name} graph")
+        graph = loader()
+        nodes = list(graph.nodes())
+
+        random.seed(0)
+        queries = [random.sample(nodes, 2) for _ in range(number_of_queries)]
+
+        start = timeit.default_timer()
+        expected = [astar.astar(graph, source, target) for source, target in queries]
+        dijkstra_time = timeit.default_timer() - start
+        dijkstra_settled = sum(result[2] for result in expected)
+
+        print(f"  Dijkstra: {dijkstra_settled / number_of_queries:.0f} settled nodes, {dijkstra_time / number_of_queries * 1000:.2f} ms per query")
+
+        for strategy in ["random", "farthest", "degree"]:
+            start = timeit.default_timer()
+            oracle = LandmarkOracle(graph, number_of_landmarks, strategy, seed=0)
+            preprocessing_time = timeit.default_timer() - start
+
+            start = timeit.default_timer()
+            results = [oracle.query(source, target) for source, target in queries]
+            query_time = timeit.default_timer() - start
+
+            for result, expected_result in zip(results, expected):
+                if result[0] != expected_result[0]:
+                    raise Exception("ALT went wrong v/s plain Dijkstra")
+
+            settled = sum(result[2] for result in results)
+            print(
+                f"  ALT ({strategy}, {number_of_landmarks} landmarks): "
+                f"{settled / number_of_queries:.0f} settled nodes, {query_time / number_of_queries * 1000:.2f} ms per query, "
+                f"preprocessing {preprocessing_time:.2f} s, {oracle.memory_per_landmark() / 1024:.1f} KiB per landmark"
+            )
+
+
+def benchmark():
+    pass
+
+
+def test(dataset: Literal["CUSTOM", "REAL_WORLD", "BENCHMARK"]):
+    if dataset == "CUSTOM":
+        return custom
+    elif dataset == "REAL_WORLD":
+        return real_world
+    else:
+        return benchmark
@@ -0,0 +1,58 @@
+from typing import Literal
+import random
+import timeit
+import networkx as nx
+from .utils import load_dhaka_graph
+from algorithms import astar
+
+def custom():
+    pass
+
+
+def real_world():
+    print("Loading the Dhaka road network")
+    graph = load_dhaka_graph()
+    coordinates = astar.load_coordinates()
+    nodes = list(max(nx.weakly_connected_components(graph), key=len))
+
+    random.seed(0)
+    number_of_queries = 20
+    number_of_runs = 5
+    totals = {"dijkstra": [0, 0.0], "astar": [0, 0.0]}
+
+    print(f"{'source':>8} {'target':>8} {'distance':>12} {'settled (Dijkstra)':>20} {'settled (A*)':>14}")
+    for _ in range(number_of_queries):
+        source, target = random.sample(nodes, 2)
+        heuristic = astar.euclidean_heuristic(coordinates, target)
+
+        dijkstra_distance, _, dijkstra_settled = astar.astar(graph, source, target)
+        astar_distance, _, astar_settled = astar.astar(graph, source, target, heuristic)
+
+        if dijkstra_distance != astar_distance:
+            raise Exception("A* went wrong v/s plain Dijkstra")
+
+        dijkstra_time = timeit.timeit(lambda: astar.astar(graph, source, target), number=number_of_runs) / number_of_runs
+        astar_time = timeit.timeit(lambda: astar.astar(graph, source, target, heuristic), number=number_of_runs) / number_of_runs
+
+        totals["dijkstra"][0] += dijkstra_settled
+        totals["dijkstra"][1] += dijkstra_time
+        totals["astar"][0] += astar_settled
+        totals["astar"][1] += astar_time
+
+        print(f"{source:>8} {target:>8} {dijkstra_distance:>12.1f} {dijkstra_settled:>20} {astar_settled:>14}")
+
+    for name, (settled, total_time) in totals.items():
+        print(f"{name}: {settled / number_of_queries:.0f} settled nodes, {total_time / number_of_queries * 1000:.2f} ms per query on average")
+
+
+def benchmark():
+    pass
+
+
+def test(dataset: Literal["CUSTOM", "REAL_WORLD", "BENCHMARK"]):
+    if dataset == "CUSTOM":
+        return custom
+    elif dataset == "REAL_WORLD":
+        return real_world
+    else:
+        return benchmark
@@ -0,0 +1,244 @@
+from typing import Literal
+import csv
+import datetime
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import networkx as nx
+import numpy as np
+from .utils import create_arbitrary_graphs, real_world_loaders
+from algorithms import dijkstra_adj_list_bin_heap, dijkstra_adj_list_fib_heap, dijkstra_adj_matrix, dijkstra_adj_list_indexed_heap, dijkstra_csr_bin_heap, dijkstra_adj_list_bucket_queue
+from algorithms.data_structures.csr_graph import CSRGraph
+
+basepath = "output/benchmarks/results"
+baseline_path = f"{basepath}/baseline.json"
+
+SEED = 42
+# Bumped whenever the benchmark graphs change, older baselines are not comparable
+SUITE_VERSION = 2
+WARMUP_RUNS = 2
+TIMED_RUNS = 10
+REGRESSION_THRESHOLD = 0.10
+
+# Showing the CLI menu may take this long, and must not load any of heavy_modules
+IMPORT_TIME_BUDGET = 0.05
+heavy_modules = ["networkx", "matplotlib", "numpy"]
+src_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# name -> (function taking (graph, csr, source), runs on graphs with up to this many nodes)
+engines = {
+    "bin_heap": (lambda graph, csr, source: dijkstra_adj_list_bin_heap.dijkstra_binary_heap(graph, source), None),
+    "fib_heap": (lambda graph, csr, source: dijkstra_adj_list_fib_heap.dijkstra_fibonacci_heap(graph, source), None),
+    "indexed_heap": (lambda graph, csr, source: dijkstra_adj_list_indexed_heap.dijkstra_indexed_heap(graph, source), None),
+    "csr_bin_heap": (lambda graph, csr, source: dijkstra_csr_bin_heap.dijkstra_csr_binary_heap(csr, source), None),
+    "bucket_queue": (lambda graph, csr, source: dijkstra_adj_list_bucket_queue.dijkstra_bucket_queue(graph, source), None),
+    # The dense versions need a V x V matrix
+    "adj_matrix": (lambda graph, csr, source: dijkstra_adj_matrix.dijkstra_adj_matrix(graph, source), 2000),
+    "adj_matrix_numpy": (lambda graph, csr, source: dijkstra_adj_matrix.dijkstra_adj_matrix_numpy(csr, source), 5000),
+}
+
+synthetic_targets = [(100, 0.1), (500, 0.1), (1000, 0.1), (1000, 0.5), (1000, 0.9)]
+
+
+def benchmark_targets():
+    # (name, graph, source); every graph and source is derived from SEED
+    for n, p in synthetic_targets:
+        yield f"gnp_n{n}_p{p}", create_arbitrary_graphs(n, p, seed=SEED), 0
+
+    rng = random.Random(SEED)
+    for name, loader in real_world_loaders.items():
+        graph = loader()
+        # Sources from the largest component so that the run does real work
+        components = nx.weakly_connected_components(graph) if graph.is_directed() else nx.connected_components(graph)
+        largest = sorted(max(components, key=len), key=str)
+        yield name, graph, rng.choice(largest)
+
+
+def time_engine(fn, warmup_runs=None, timed_runs=None):
+    warmup_runs = WARMUP_RUNS if warmup_runs is None else warmup_runs
+    timed_runs = TIMED_RUNS if timed_runs is None else timed_runs
+
+    for _ in range(warmup_runs):
+        fn()
+
+    timings = []
+    for _ in range(timed_runs):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+
+    timings.sort()
+    return {
+        "min": timings[0],
+        "median": statistics.median(timings),
+        "p95": float(np.percentile(timings, 95)),
+        "mean": statistics.fmean(timings),
+        "runs": timed_runs,
+    }
+
+
+def environment():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": sys.version,
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "networkx": nx.__version__,
+        "numpy": np.__version__,
+        "commit": commit,
+        "seed": SEED,
+        "warmup_runs": WARMUP_RUNS,
+        "timed_runs": TIMED_RUNS,
+    }
+
+
+def cli_import_time(runs=3):
+    """Imports cli in fresh interpreters under -X importtime.
+
+    Returns the best cumulative import time in seconds and the heavy modules
+    that the import pulled in.
+    """
+
+    best, loaded = float('inf'), set()
+    for _ in range(runs):
+        stderr = subprocess.run([sys.executable, "-X", "importtime", "-c", "import cli"], cwd=src_path, capture_output=True, text=True, check=True).stderr
+        # Lines look like "import time:  self [us] | cumulative | imported package"
+        for line in stderr.splitlines():
+            fields = line.removeprefix("import time:").split("|")
+            if len(fields) != 3 or not fields[1].strip().isdigit():
+                continue
+
+            name = fields[2].strip()
+            if name == "cli":
+                best = min(best, int(fields[1]) / 1e6)
+            if name.split(".")[0] in heavy_modules:
+                loaded.add(name.split(".")[0])
+
+    return best, sorted(loaded)
+
+
+def run_suite():
+    results = []
+    for target, graph, source in benchmark_targets():
+        csr = CSRGraph.from_networkx(graph)
+        for engine, (fn, max_nodes) in engines.items():
+            if max_nodes is not None and graph.number_of_nodes() > max_nodes:
+                continue
+
+            print(f"Benchmarking {engine} on {target}")
+            timings = time_engine(lambda: fn(graph, csr, source))
+            results.append({
+                "target": target,
+                "engine": engine,
+                "nodes": graph.number_of_nodes(),
+                "edges": graph.number_of_edges(),
+                **timings,
+            })
+
+    import_time, loaded = cli_import_time()
+
+    return {"suite_version": SUITE_VERSION, "environment": environment(), "results": results, "cli_import": {"seconds": import_time, "heavy_modules": loaded}}
+
+
+def save_results(report, path_stem):
+    os.makedirs(os.path.dirname(path_stem) or ".", exist_ok=True)
+
+    with open(f"{path_stem}.json", "w") as f:
+        json.dump(report, f, indent=2)
+
+    with open(f"{path_stem}.csv", "w", newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(report["results"][0].keys()))
+        writer.writeheader()
+        writer.writerows(report["results"])
+
+
+def compare_results(report, baseline, threshold=REGRESSION_THRESHOLD):
+    """Returns the (target, engine, baseline median, current median) rows that got slower by more than threshold."""
+
+    baseline_medians = {(row["target"], row["engine"]): row["median"] for row in baseline["results"]}
+    regressions = []
+    for row in report["results"]:
+        key = (row["target"], row["engine"])
+        if key in baseline_medians and row["median"] > baseline_medians[key] * (1 + threshold):
+            regressions.append((*key, baseline_medians[key], row["median"]))
+
+    return regressions
+
+
+def import_regressions(cli_import, budget=IMPORT_TIME_BUDGET):
+    # The import-time budget is absolute, so it is checked even without a baseline
+    regressions = []
+    if cli_import["seconds"] > budget:
+        regressions.append(f"CLI import: {cli_import['seconds'] * 1000:.1f} ms, over the {budget * 1000:.0f} ms budget")
+    if cli_import["heavy_modules"]:
+        regressions.append(f"CLI import: loads {', '.join(cli_import['heavy_modules'])} before showing the menu")
+
+    return regressions
+
+
+def custom():
+    pass
+
+
+def real_world():
+    pass
+
+
+def benchmark():
+    report = run_suite()
+
+    stamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    save_results(report, f"{basepath}/{stamp}")
+    print(f"Saved the results at {basepath}/{stamp}.json and .csv")
+
+    cli_import = report["cli_import"]
+    print(f"CLI import time: {cli_import['seconds'] * 1000:.1f} ms (budget {IMPORT_TIME_BUDGET * 1000:.0f} ms)")
+
+    print(f"\n{'target':<18} {'engine':<18} {'min (ms)':>10} {'median (ms)':>12} {'p95 (ms)':>10}")
+    for row in report["results"]:
+        print(f"{row['target']:<18} {row['engine']:<18} {row['min'] * 1000:>10.2f} {row['median'] * 1000:>12.2f} {row['p95'] * 1000:>10.2f}")
+
+    baseline = None
+    if os.path.exists(baseline_path):
+        with open(baseline_path) as f:
+            baseline = json.load(f)
+
+    regressions = []
+    if baseline is None or baseline.get("suite_version") != SUITE_VERSION:
+        with open(baseline_path, "w") as f:
+            json.dump(report, f, indent=2)
+        reason = "No baseline found" if baseline is None else "The baseline was run on different benchmark graphs"
+        print(f"\n{reason}, stored this run as {baseline_path}")
+    else:
+        for target, engine, before, after in compare_results(report, baseline):
+            regressions.append(f"{target} / {engine}: {before * 1000:.2f} ms -> {after * 1000:.2f} ms ({after / before - 1:+.0%})")
+
+    regressions += import_regressions(cli_import)
+    if not regressions:
+        print(f"\nNo regressions beyond {REGRESSION_THRESHOLD:.0%} against {baseline_path}, CLI import within budget")
+        return
+
+    print(f"\nRegressions (timings beyond {REGRESSION_THRESHOLD:.0%} against {baseline_path}, CLI import over budget):")
+    for regression in regressions:
+        print(f"  {regression}")
+
+
+def test(dataset: Literal["CUSTOM", "REAL_WORLD", "BENCHMARK"]):
+    if dataset == "CUSTOM":
+        return custom
+    elif dataset == "REAL_WORLD":
+        return real_world
+    else:
+        return benchmark
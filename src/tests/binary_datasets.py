@@ -0,0 +1,37 @@
+import os
+from algorithms.data_structures.csr_graph import CSRGraph
+
+# The real-world datasets in the binary CSR format. Nothing here imports
+# NetworkX at module level, so the headless CLI modes start fast; only the
+# one-time conversion from the raw files goes through tests.utils.
+
+# The keys of utils.real_world_loaders
+dataset_names = ["dhaka", "lastfm", "epa"]
+
+binary_basepath = "data/binary"
+
+
+def binary_dataset_path(name):
+    return f"{binary_basepath}/{name}.csr"
+
+
+def convert_real_world_dataset(name):
+    """One-time conversion of a real-world dataset into the binary CSR format"""
+
+    from .utils import real_world_loaders
+
+    os.makedirs(binary_basepath, exist_ok=True)
+    path = binary_dataset_path(name)
+    CSRGraph.from_networkx(real_world_loaders[name]()).save(path)
+
+    return path
+
+
+def load_binary_dataset(name):
+    """Memory-maps a converted dataset, converting it first if needed. No NetworkX graph is built."""
+
+    path = binary_dataset_path(name)
+    if not os.path.exists(path):
+        convert_real_world_dataset(name)
+
+    return CSRGraph.load(path)
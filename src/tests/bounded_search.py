@@ -0,0 +1,59 @@
+from typing import Literal
+import random
+import timeit
+import networkx as nx
+from .utils import load_dhaka_graph
+from algorithms import bounded_search
+from algorithms.dijkstra_adj_list_bin_heap import dijkstra_binary_heap
+
+def custom():
+    pass
+
+
+def real_world():
+    print("Loading the Dhaka road network")
+    graph = load_dhaka_graph()
+    nodes = sorted(max(nx.weakly_connected_components(graph), key=len))
+
+    random.seed(0)
+    number_of_runs = 5
+    source = random.choice(nodes)
+    distances, _ = dijkstra_binary_heap(graph, source)
+    full_time = timeit.timeit(lambda: dijkstra_binary_heap(graph, source), number=number_of_runs) / number_of_runs
+    print(f"Full Dijkstra from {source}: {full_time * 1000:.2f} ms")
+
+    # Isochrones around one node, lengths are in metres
+    for radius in [500, 1000, 2000, 5000]:
+        reached = list(bounded_search.within_radius(graph, source, radius))
+        expected = sum(1 for distance in distances.values() if distance <= radius)
+        if len(reached) != expected or any(item.distance != distances[item.node] for item in reached):
+            raise Exception("The radius-bounded search went wrong v/s plain Dijkstra")
+
+        elapsed = timeit.timeit(lambda: list(bounded_search.within_radius(graph, source, radius)), number=number_of_runs) / number_of_runs
+        print(f"  within {radius:>5} m: {len(reached):>5} nodes in {elapsed * 1000:.2f} ms")
+
+    # The k closest of a set of facilities
+    facilities = set(random.sample(nodes, 100))
+    for k in [1, 5, 20]:
+        nearest = list(bounded_search.k_nearest(graph, source, k, targets=facilities))
+        elapsed = timeit.timeit(lambda: list(bounded_search.k_nearest(graph, source, k, targets=facilities)), number=number_of_runs) / number_of_runs
+        print(f"  {k:>2} nearest of {len(facilities)} facilities in {elapsed * 1000:.2f} ms, farthest at {nearest[-1].distance:.0f} m")
+
+    # Multi-source: which facility serves each node within 3 km
+    served = {}
+    for item in bounded_search.within_radius(graph, facilities, 3000):
+        served[item.origin] = served.get(item.origin, 0) + 1
+    print(f"  {sum(served.values())} nodes within 3000 m of a facility, split over {len(served)} facilities (largest area: {max(served.values())} nodes)")
+
+
+def benchmark():
+    pass
+
+
+def test(dataset: Literal["CUSTOM", "REAL_WORLD", "BENCHMARK"]):
+    if dataset == "CUSTOM":
+        return custom
+    elif dataset == "REAL_WORLD":
+        return real_world
+    else:
+        return benchmark
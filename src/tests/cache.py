@@ -0,0 +1,54 @@
+from typing import Literal
+import math
+import timeit
+import networkx as nx
+from .utils import load_dhaka_graph
+from algorithms import dijkstra_adj_list_bin_heap
+from algorithms.cache import ShortestPathCache
+
+def check_mutations(graph, source, cache):
+    # In-place edits keep the node and edge counts, the cache must still notice them
+    for u, v in list(graph.edges())[:3]:
+        cache(graph, source)
+        invalidations = cache.invalidations
+        graph[u][v]['weight'] = graph[u][v].get('weight', 1) * 3 + 1
+
+        distances, _ = cache(graph, source)
+        expected, _ = dijkstra_adj_list_bin_heap.dijkstra_binary_heap(graph, source)
+        for node, distance in expected.items():
+            if not math.isclose(distance, distances[node]):
+                raise Exception("Shortest path cache served a stale tree after a weight edit")
+        if cache.invalidations == invalidations:
+            raise Exception("Shortest path cache did not invalidate the tree of the mutated graph")
+
+
+def custom():
+    pass
+
+
+def real_world():
+    print("Loading the Dhaka road network")
+    graph = load_dhaka_graph()
+    source = max(nx.weakly_connected_components(graph), key=len).pop()
+    cache = ShortestPathCache()
+
+    number_of_runs = 10
+    miss_time = timeit.timeit(lambda: (cache.clear(), cache(graph, source)), number=number_of_runs) / number_of_runs
+    hit_time = timeit.timeit(lambda: cache(graph, source), number=number_of_runs) / number_of_runs
+    print(f"Miss: {miss_time * 1000:.2f} ms, hit: {hit_time * 1000:.2f} ms ({miss_time / hit_time:.1f}x)")
+
+    check_mutations(graph, source, cache)
+    print(f"Weight edits are detected, {cache.stats()}")
+
+
+def benchmark():
+    pass
+
+
+def test(dataset: Literal["CUSTOM", "REAL_WORLD", "BENCHMARK"]):
+    if dataset == "CUSTOM":
+        return custom
+    elif dataset == "REAL_WORLD":
+        return real_world
+    else:
+        return benchmark
@@ -1,46 +1,138 @@
 from typing import Literal
+from concurrent.futures import ProcessPoolExecutor
+import json
+import os
 import timeit
-from .utils import create_arbitrary_graphs, compare_dijkstra_results, normalise_dijkstra_preds
+from .utils import create_random_graph, compare_dijkstra_results, normalise_dijkstra_preds
 from algorithms import dijkstra_adj_list_bin_heap, dijkstra_adj_list_fib_heap, dijkstra_adj_matrix
+from algorithms.instrumentation import instrumented
 import matplotlib.pyplot as plt
 
 basepath = "output/benchmarks/comparisons"
+GENERATOR = "random_csr_graph"
+# One directory per graph generator, so cells from different generators never mix
+checkpoint_basepath = f"{basepath}/checkpoints/{GENERATOR}"
+
+SEED = 42
+SOURCE = 0
+
+# Worker processes for the n x p grid, overridden by BENCHMARK_WORKERS. One by
+# default: cells timed in parallel compete for cores and memory bandwidth,
+# which skews their wall-clock times
+WORKERS = int(os.environ.get("BENCHMARK_WORKERS", 1))
+
+NUMBER_OF_RUNS = 10
+ENGINES = ["avg_time_bin_heap", "avg_time_dijkstra_adj_list_fib_heap", "avg_time_dijkstra_adj_matrix", "avg_time_dijkstra_adj_matrix_numpy"]
+
+# Stored in every checkpoint, a cell written under a different config is recomputed
+CONFIG = {
+    "generator": GENERATOR,
+    "seed": SEED,
+    "seed_scheme": "SEED + round(p * 10) * 100000 + n",
+    "source": SOURCE,
+    "number_of_runs": NUMBER_OF_RUNS,
+    "engines": ENGINES,
+}
 
 def custom():
     pass
 
 
+def print_counters(graph, avg_times):
+    # One instrumented run per engine, separate from the timed runs
+    for name, (engine, avg_time) in avg_times.items():
+        counters = instrumented(engine, graph, SOURCE)[2]
+        print(f"  {name:<10} {avg_time * 1000:9.2f} ms  pushes={counters.pushes} pops={counters.pops} stale_pops={counters.stale_pops} "
+              f"decrease_keys={counters.decrease_keys} cascading_cuts={counters.cascading_cuts} consolidations={counters.consolidations} relaxations={counters.relaxations}")
+
+
 def real_world():
     print("Testing Dongguan")
 
 
+def cell_seed(p, n):
+    # Deterministic per cell, independent of which worker runs it or in which order
+    return SEED + round(p * 10) * 100_000 + n
+
+
+def checkpoint_path(p, n):
+    return f"{checkpoint_basepath}/p{p}_n{n}.json"
+
+
+def run_cell(p, n):
+    path = checkpoint_path(p, n)
+    if os.path.exists(path):
+        with open(path) as f:
+            checkpoint = json.load(f)
+        if checkpoint.get("config") == CONFIG:
+            return checkpoint["result"]
+        print(f"Ignoring stale checkpoint {path}, it was written under a different config")
+
+    print(f"Checking at probability {p}, vertex count {n}")
+    graph = create_random_graph(n, p, seed=cell_seed(p, n))
+
+    benchmark_fn_bin_heap = lambda: dijkstra_adj_list_bin_heap.dijkstra_binary_heap(graph, SOURCE)
+    benchmark_fn_dijkstra_adj_list_fib_heap = lambda: dijkstra_adj_list_fib_heap.dijkstra_fibonacci_heap(graph, SOURCE)
+    benchmark_fn_dijkstra_adj_matrix = lambda: dijkstra_adj_matrix.dijkstra_adj_matrix(graph, SOURCE)
+    benchmark_fn_dijkstra_adj_matrix_numpy = lambda: dijkstra_adj_matrix.dijkstra_adj_matrix_numpy(graph, SOURCE)
+
+    avg_time_bin_heap = timeit.timeit(benchmark_fn_bin_heap, number=NUMBER_OF_RUNS) / NUMBER_OF_RUNS
+    avg_time_dijkstra_adj_list_fib_heap = timeit.timeit(benchmark_fn_dijkstra_adj_list_fib_heap, number=NUMBER_OF_RUNS) / NUMBER_OF_RUNS
+    avg_time_dijkstra_adj_matrix = timeit.timeit(benchmark_fn_dijkstra_adj_matrix, number=NUMBER_OF_RUNS) / NUMBER_OF_RUNS
+    avg_time_dijkstra_adj_matrix_numpy = timeit.timeit(benchmark_fn_dijkstra_adj_matrix_numpy, number=NUMBER_OF_RUNS) / NUMBER_OF_RUNS
+
+    # --- All four results ---
+    result = {
+        "n": n, 
+        "avg_time_bin_heap": avg_time_bin_heap,
+        "avg_time_dijkstra_adj_list_fib_heap": avg_time_dijkstra_adj_list_fib_heap,
+        "avg_time_dijkstra_adj_matrix": avg_time_dijkstra_adj_matrix,
+        "avg_time_dijkstra_adj_matrix_numpy": avg_time_dijkstra_adj_matrix_numpy
+    }
+
+    # Write then rename, so an interrupted run never leaves a half-written checkpoint
+    with open(f"{path}.tmp", "w") as f:
+        json.dump({"config": CONFIG, "result": result}, f)
+    os.replace(f"{path}.tmp", path)
+
+    return result
+
+
 def benchmark():
     # Varying density, constant n
     n = 1000
-    SOURCE = 0
     print(f"Checking for constant n = {n}")
 
     results_vs_p = []
     for p in [i / 10.0 for i in range(1, 10)]:
         print(f"Checking for p = {p}")
-        graph = create_arbitrary_graphs(n, p)
+        graph = create_random_graph(n, p, seed=cell_seed(p, n))
 
-        # --- Time all three functions ---
+        # --- Time all four functions ---
         benchmark_fn_bin_heap = lambda: dijkstra_adj_list_bin_heap.dijkstra_binary_heap(graph, SOURCE)
         benchmark_fn_dijkstra_adj_list_fib_heap = lambda: dijkstra_adj_list_fib_heap.dijkstra_fibonacci_heap(graph, SOURCE)
         benchmark_fn_dijkstra_adj_matrix = lambda: dijkstra_adj_matrix.dijkstra_adj_matrix(graph, SOURCE)
+        benchmark_fn_dijkstra_adj_matrix_numpy = lambda: dijkstra_adj_matrix.dijkstra_adj_matrix_numpy(graph, SOURCE)
         
         number_of_runs = 10
 
         avg_time_bin_heap = timeit.timeit(benchmark_fn_bin_heap, number=number_of_runs) / number_of_runs
         avg_time_dijkstra_adj_list_fib_heap = timeit.timeit(benchmark_fn_dijkstra_adj_list_fib_heap, number=number_of_runs) / number_of_runs
         avg_time_dijkstra_adj_matrix = timeit.timeit(benchmark_fn_dijkstra_adj_matrix, number=number_of_runs) / number_of_runs
+        avg_time_dijkstra_adj_matrix_numpy = timeit.timeit(benchmark_fn_dijkstra_adj_matrix_numpy, number=number_of_runs) / number_of_runs
         
         results_vs_p.append({
             "p": p, 
             "avg_time_bin_heap": avg_time_bin_heap,
             "avg_time_dijkstra_adj_list_fib_heap": avg_time_dijkstra_adj_list_fib_heap,
-            "avg_time_dijkstra_adj_matrix": avg_time_dijkstra_adj_matrix
+            "avg_time_dijkstra_adj_matrix": avg_time_dijkstra_adj_matrix,
+            "avg_time_dijkstra_adj_matrix_numpy": avg_time_dijkstra_adj_matrix_numpy
+        })
+
+        print_counters(graph, {
+            "Bin Heap": (dijkstra_adj_list_bin_heap.dijkstra_binary_heap, avg_time_bin_heap),
+            "Fib Heap": (dijkstra_adj_list_fib_heap.dijkstra_fibonacci_heap, avg_time_dijkstra_adj_list_fib_heap),
+            "Adj Matrix": (dijkstra_adj_matrix.dijkstra_adj_matrix, avg_time_dijkstra_adj_matrix),
         })
 
     path = f"{basepath}/time_vs_prob_with_{n}.png"
@@ -57,6 +149,9 @@ def benchmark():
     # Plot Red line: dijkstra_adj_matrix
     plt.plot(p_values, [item["avg_time_dijkstra_adj_matrix"] for item in results_vs_p], color="red", label="Adj Matrix (dijkstra_adj_matrix)", marker='^')
 
+    # Plot Orange line: dijkstra_adj_matrix_numpy
+    plt.plot(p_values, [item["avg_time_dijkstra_adj_matrix_numpy"] for item in results_vs_p], color="orange", label="Adj Matrix NumPy (dijkstra_adj_matrix_numpy)", marker='v')
+
     plt.xlabel("Edge Probability (Graph Density)")
     plt.ylabel("Average Time (seconds)")
     plt.title(f"Runtime vs. Graph Density (n={n})")
@@ -67,35 +162,23 @@ def benchmark():
 
 
     # Varying n, 'constant' densities
-    final_results = []
-
-    for p in [i / 10.0 for i in range(1, 10)]:
-        results_vs_n = []
-        for n in range(10, 1000, 10): 
-            print(f"Checking at probability {p}, vertex count {n}")
-            graph = create_arbitrary_graphs(n, p)
-
-            benchmark_fn_bin_heap = lambda: dijkstra_adj_list_bin_heap.dijkstra_binary_heap(graph, SOURCE)
-            benchmark_fn_dijkstra_adj_list_fib_heap = lambda: dijkstra_adj_list_fib_heap.dijkstra_fibonacci_heap(graph, SOURCE)
-            benchmark_fn_dijkstra_adj_matrix = lambda: dijkstra_adj_matrix.dijkstra_adj_matrix(graph, SOURCE)
-
-            number_of_runs = 10
-
-            avg_time_bin_heap = timeit.timeit(benchmark_fn_bin_heap, number=number_of_runs) / number_of_runs
-            avg_time_dijkstra_adj_list_fib_heap = timeit.timeit(benchmark_fn_dijkstra_adj_list_fib_heap, number=number_of_runs) / number_of_runs
-            avg_time_dijkstra_adj_matrix = timeit.timeit(benchmark_fn_dijkstra_adj_matrix, number=number_of_runs) / number_of_runs
-
-            # --- Append all three results ---
-            results_vs_n.append({
-                "n": n, 
-                "avg_time_bin_heap": avg_time_bin_heap,
-                "avg_time_dijkstra_adj_list_fib_heap": avg_time_dijkstra_adj_list_fib_heap,
-                "avg_time_dijkstra_adj_matrix": avg_time_dijkstra_adj_matrix
-            })
+    # Every (p, n) cell is independent, seeded on its own and checkpointed,
+    # so the grid can run on a worker pool and an interrupted sweep resumes
+    os.makedirs(checkpoint_basepath, exist_ok=True)
+    print(f"Checkpoints are kept in {checkpoint_basepath}, delete it to start the sweep over")
+    probabilities = [i / 10.0 for i in range(1, 10)]
+    cells = [(p, n) for p in probabilities for n in range(10, 1000, 10)]
+    if WORKERS > 1:
+        print(f"Warning: timing cells on {WORKERS} workers at once, the times are taken under contention")
+
+    with ProcessPoolExecutor(max_workers=WORKERS) as pool:
+        cell_results = list(pool.map(run_cell, *zip(*cells)))
 
+    final_results = []
+    for p in probabilities:
         final_results.append({
             "p": p,
-            "res": results_vs_n,
+            "res": [result for (cell_p, _), result in zip(cells, cell_results) if cell_p == p],
         })
 
     for i in final_results:
@@ -116,6 +199,10 @@ def benchmark():
         plt.plot(n_values, [item["avg_time_dijkstra_adj_matrix"] for item in results], 
                 color="red", label="Adj Matrix (dijkstra_adj_matrix)", marker='^')
 
+        # Plot Orange line: dijkstra_adj_matrix_numpy
+        plt.plot(n_values, [item["avg_time_dijkstra_adj_matrix_numpy"] for item in results], 
+                color="orange", label="Adj Matrix NumPy (dijkstra_adj_matrix_numpy)", marker='v')
+
         plt.xlabel("n (Number of Nodes)")
         plt.ylabel("Average Time (seconds)")
         plt.title(f"Runtime vs. Number of Nodes (edge probability {p})")
@@ -0,0 +1,72 @@
+from typing import Literal
+import os
+import random
+import timeit
+from .utils import load_dhaka_graph
+from algorithms import dijkstra_adj_list_bin_heap
+from algorithms.contraction_hierarchy import ContractionHierarchy
+
+index_path = "output/real_world/dhaka.ch"
+
+def custom():
+    pass
+
+
+def real_world():
+    print("Loading the Dhaka road network")
+    graph = load_dhaka_graph()
+
+    # The index is built once and reused across runs, as long as the graph is unchanged
+    ch = None
+    if os.path.exists(index_path):
+        print(f"Loading the contraction hierarchy from {index_path}")
+        ch = ContractionHierarchy.load(index_path)
+        if not ch.matches(graph):
+            print("The saved contraction hierarchy was built from a different graph, rebuilding it")
+            ch = None
+
+    if ch is None:
+        print("Building the contraction hierarchy (this takes a while)")
+        start = timeit.default_timer()
+        ch = ContractionHierarchy.build(graph)
+        build_time = timeit.default_timer() - start
+        ch.save(index_path)
+        print(f"Built in {build_time:.1f} seconds with {ch.num_shortcuts} shortcuts, saved to {index_path}")
+
+    random.seed(0)
+    nodes = list(graph.nodes())
+    number_of_sources = 10
+    targets_per_source = 100
+    dijkstra_time = 0.0
+    query_time = 0.0
+
+    for _ in range(number_of_sources):
+        source = random.choice(nodes)
+
+        start = timeit.default_timer()
+        distances, _ = dijkstra_adj_list_bin_heap.dijkstra_binary_heap(graph, source)
+        dijkstra_time += timeit.default_timer() - start
+
+        for target in random.sample(nodes, targets_per_source):
+            start = timeit.default_timer()
+            distance, _ = ch.query(source, target)
+            query_time += timeit.default_timer() - start
+
+            if distance != distances[target]:
+                raise Exception("Contraction hierarchy went wrong v/s Dijkstra Binary Heap implementation")
+
+    print(f"Dijkstra (full tree): {dijkstra_time / number_of_sources * 1000:.2f} ms per source")
+    print(f"Contraction hierarchy: {query_time / (number_of_sources * targets_per_source) * 1000:.3f} ms per query")
+
+
+def benchmark():
+    pass
+
+
+def test(dataset: Literal["CUSTOM", "REAL_WORLD", "BENCHMARK"]):
+    if dataset == "CUSTOM":
+        return custom
+    elif dataset == "REAL_WORLD":
+        return real_world
+    else:
+        return benchmark
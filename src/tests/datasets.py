@@ -0,0 +1,51 @@
+from typing import Literal
+import os
+import timeit
+from .utils import real_world_loaders
+from .binary_datasets import convert_real_world_dataset, load_binary_dataset
+from algorithms.dijkstra_csr_bin_heap import dijkstra_csr_binary_heap
+from algorithms.ingest import ingest
+
+raw_edge_lists = {
+    "data/real_world/Dhaka_Edgelist.csv": "dhaka_csv",
+    "data/real_world/dhaka_road_data.txt": "dhaka_tsv",
+    "data/real_world/lastfm_asia_edges.csv": "lastfm_csv",
+    "data/real_world/web-EPA.edges": "edges",
+}
+
+def custom():
+    pass
+
+
+def real_world():
+    print("Streaming the raw edge lists")
+    for path, edge_format in raw_edge_lists.items():
+        graph, stats = ingest(path, edge_format, chunk_size=64 * 1024)
+        print(f"  {path}: {graph.num_nodes} nodes, {stats.edges} edges in {stats.chunks} chunks, {stats.edges_per_second:,.0f} edges/sec")
+
+    for name, loader in real_world_loaders.items():
+        print(f"Converting {name}")
+        path = convert_real_world_dataset(name)
+
+        text_time = timeit.timeit(loader, number=1)
+        number_of_runs = 10
+        binary_time = timeit.timeit(lambda: load_binary_dataset(name), number=number_of_runs) / number_of_runs
+
+        graph = load_binary_dataset(name)
+        query_time = timeit.timeit(lambda: dijkstra_csr_binary_heap(graph, graph.labels[0]), number=1)
+
+        print(f"  {path}: {os.path.getsize(path) / 1024:.0f} KiB, {graph.num_nodes} nodes, {graph.num_edges} directed edges")
+        print(f"  Text + NetworkX load: {text_time * 1000:.1f} ms, binary mmap load: {binary_time * 1000:.2f} ms, one Dijkstra: {query_time * 1000:.1f} ms")
+
+
+def benchmark():
+    pass
+
+
+def test(dataset: Literal["CUSTOM", "REAL_WORLD", "BENCHMARK"]):
+    if dataset == "CUSTOM":
+        return custom
+    elif dataset == "REAL_WORLD":
+        return real_world
+    else:
+        return benchmark
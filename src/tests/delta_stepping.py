@@ -0,0 +1,74 @@
+from typing import Literal
+import os
+import timeit
+import networkx as nx
+from .utils import real_world_loaders
+from algorithms.data_structures.csr_graph import CSRGraph
+from algorithms.delta_stepping import delta_stepping_arrays, default_delta
+from algorithms.dijkstra_csr_bin_heap import dijkstra_csr_arrays
+import matplotlib.pyplot as plt
+
+basepath = "output/benchmarks/delta_stepping"
+
+# Delta as a multiple of the mean edge weight of each graph
+delta_multipliers = [0.25, 0.5, 1, 2, 4, 8, 16, 64]
+
+def custom():
+    pass
+
+
+def real_world():
+    pass
+
+
+def benchmark():
+    os.makedirs(basepath, exist_ok=True)
+    number_of_runs = 5
+
+    for name, loader in real_world_loaders.items():
+        graph = loader()
+        components = nx.weakly_connected_components(graph) if graph.is_directed() else nx.connected_components(graph)
+        source_label = min(max(components, key=len))
+
+        csr = CSRGraph.from_networkx(graph)
+        source = csr.index[source_label]
+        mean_weight = default_delta(csr)
+
+        heap_time = timeit.timeit(lambda: dijkstra_csr_arrays(csr, source), number=number_of_runs) / number_of_runs
+        heap_dist, _ = dijkstra_csr_arrays(csr, source)
+
+        print(f"{name}: {csr.num_nodes} nodes, {csr.num_edges} directed edges, mean weight {mean_weight:.2f}")
+        print(f"  CSR binary heap: {heap_time * 1000:.2f} ms")
+
+        deltas, times = [], []
+        for multiplier in delta_multipliers:
+            delta = mean_weight * multiplier
+            elapsed = timeit.timeit(lambda: delta_stepping_arrays(csr, source, delta), number=number_of_runs) / number_of_runs
+            dist, _ = delta_stepping_arrays(csr, source, delta)
+            matches = all(a == b or abs(a - b) <= 1e-9 * abs(a) for a, b in zip(heap_dist, dist.tolist()))
+
+            deltas.append(delta)
+            times.append(elapsed)
+            print(f"  delta = {delta:10.2f}: {elapsed * 1000:8.2f} ms ({heap_time / elapsed:.2f}x), distances match: {matches}")
+
+        plt.plot(deltas, times, marker='o', label="Delta-stepping")
+        plt.axhline(heap_time, color="green", linestyle="--", label="CSR binary heap")
+        plt.xscale("log")
+        plt.xlabel("Delta")
+        plt.ylabel("Average Time (seconds)")
+        plt.title(f"Delta-stepping on {name} ({csr.num_nodes} nodes)")
+        plt.legend()
+        plt.tight_layout()
+        plt.savefig(f"{basepath}/delta_sweep_{name}.png")
+        plt.clf()
+
+    print(f"Saved your files at {basepath}")
+
+
+def test(dataset: Literal["CUSTOM", "REAL_WORLD", "BENCHMARK"]):
+    if dataset == "CUSTOM":
+        return custom
+    elif dataset == "REAL_WORLD":
+        return real_world
+    else:
+        return benchmark
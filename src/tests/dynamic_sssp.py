@@ -0,0 +1,75 @@
+from typing import Literal
+import math
+import random
+import timeit
+import networkx as nx
+from .utils import load_dhaka_graph
+from algorithms import dijkstra_adj_list_bin_heap
+from algorithms.dynamic_sssp import DynamicSSSP
+
+def custom():
+    pass
+
+
+def random_updates(graph, count, rng):
+    # Closures (deletions), congestion (increases), reopenings and improvements (decreases)
+    edges = list(graph.edges())
+    updates = []
+    for u, v in rng.sample(edges, count):
+        weight = graph[u][v]['weight']
+        kind = rng.random()
+        if kind < 0.2:
+            updates.append((u, v, None))
+        elif kind < 0.7:
+            updates.append((u, v, weight * rng.uniform(1.0, 3.0)))
+        else:
+            updates.append((u, v, weight * rng.uniform(0.5, 1.0)))
+
+    return updates
+
+
+def real_world():
+    print("Loading the Dhaka road network")
+    graph = load_dhaka_graph()
+    source = max(nx.weakly_connected_components(graph), key=len).pop()
+
+    rng = random.Random(0)
+    number_of_batches = 10
+
+    print(f"{'batch size':>10} {'repair (ms)':>12} {'recompute (ms)':>15} {'speedup':>8}")
+    for batch_size in [1, 10, 100]:
+        dynamic = DynamicSSSP(graph, source)
+        repair_time = 0.0
+        recompute_time = 0.0
+
+        for _ in range(number_of_batches):
+            updates = random_updates(graph, batch_size, rng)
+
+            start = timeit.default_timer()
+            dynamic.apply(updates)
+            repair_time += timeit.default_timer() - start
+
+            start = timeit.default_timer()
+            distances, _ = dijkstra_adj_list_bin_heap.dijkstra_binary_heap(graph, source)
+            recompute_time += timeit.default_timer() - start
+
+            for node, distance in distances.items():
+                if not math.isclose(distance, dynamic.distances[node]):
+                    raise Exception("Incremental SSSP went wrong v/s Dijkstra Binary Heap implementation")
+
+        repair_ms = repair_time / number_of_batches * 1000
+        recompute_ms = recompute_time / number_of_batches * 1000
+        print(f"{batch_size:>10} {repair_ms:>12.2f} {recompute_ms:>15.2f} {recompute_ms / repair_ms:>7.1f}x")
+
+
+def benchmark():
+    pass
+
+
+def test(dataset: Literal["CUSTOM", "REAL_WORLD", "BENCHMARK"]):
+    if dataset == "CUSTOM":
+        return custom
+    elif dataset == "REAL_WORLD":
+        return real_world
+    else:
+        return benchmark
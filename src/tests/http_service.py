@@ -0,0 +1,112 @@
+from typing import Literal
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import json
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+from .binary_datasets import dataset_names, load_binary_dataset
+from algorithms.http_service import QueryServer, make_executor
+
+SEED = 42
+NUMBER_OF_REQUESTS = 300
+CLIENT_THREADS = 16
+# Few distinct sources, so that concurrent requests overlap and get coalesced
+SOURCES_PER_DATASET = 5
+
+def start_in_background(server):
+    # Runs the server on its own event loop thread and returns (port, stop function)
+    loop = asyncio.new_event_loop()
+    started = threading.Event()
+    port = []
+
+    async def main():
+        listener = await server.start("127.0.0.1", 0)
+        port.append(listener.sockets[0].getsockname()[1])
+        started.set()
+        async with listener:
+            await listener.serve_forever()
+
+    task = loop.create_task(main())
+
+    def run():
+        try:
+            loop.run_until_complete(task)
+        except asyncio.CancelledError:
+            pass
+        loop.close()
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    started.wait()
+
+    def stop():
+        loop.call_soon_threadsafe(task.cancel)
+        thread.join()
+
+    return port[0], stop
+
+
+def get(port, endpoint, **params):
+    query = "&".join(f"{name}={value}" for name, value in params.items())
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/{endpoint}?{query}") as response:
+            return json.load(response)
+    except urllib.error.HTTPError as e:
+        # Error responses carry a JSON body too
+        return json.load(e)
+
+
+def custom():
+    pass
+
+
+def real_world():
+    pass
+
+
+def benchmark():
+    graphs = {name: load_binary_dataset(name) for name in dataset_names}
+    executor = make_executor(graphs, "process")
+    port, stop = start_in_background(QueryServer(graphs, executor))
+    print(f"Serving {', '.join(graphs)} on http://127.0.0.1:{port}")
+
+    rng = random.Random(SEED)
+    sources = {name: rng.sample(graph.labels, SOURCES_PER_DATASET) for name, graph in graphs.items()}
+    requests = []
+    for _ in range(NUMBER_OF_REQUESTS):
+        dataset = rng.choice(list(graphs))
+        endpoint = rng.choice(["distance", "path", "path", "distance", "tree"])
+        params = {"dataset": dataset, "source": rng.choice(sources[dataset])}
+        if endpoint != "tree":
+            params["target"] = rng.choice(graphs[dataset].labels)
+        requests.append((endpoint, params))
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=CLIENT_THREADS) as clients:
+        responses = list(clients.map(lambda request: get(port, request[0], **request[1]), requests))
+    elapsed = time.perf_counter() - start
+
+    errors = [response for response in responses if "error" in response]
+    print(f"{len(requests)} requests from {CLIENT_THREADS} client threads in {elapsed:.2f} s ({len(requests) / elapsed:.0f} requests/sec), {len(errors)} errors")
+
+    stats = get(port, "stats")
+    print(f"SSSP runs: {stats['computed']}, coalesced: {stats['coalesced']}, cache hits: {stats['cache_hits']}")
+    for endpoint, histogram in stats["latency"].items():
+        if histogram["count"]:
+            buckets = ", ".join(f"{bound}: {count}" for bound, count in histogram["buckets_ms"].items() if count)
+            print(f"  /{endpoint}: {histogram['count']} requests, mean {histogram['mean_ms']:.2f} ms, max {histogram['max_ms']:.2f} ms ({buckets})")
+
+    stop()
+    executor.shutdown(cancel_futures=True)
+
+
+def test(dataset: Literal["CUSTOM", "REAL_WORLD", "BENCHMARK"]):
+    if dataset == "CUSTOM":
+        return custom
+    elif dataset == "REAL_WORLD":
+        return real_world
+    else:
+        return benchmark
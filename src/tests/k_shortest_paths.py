@@ -0,0 +1,68 @@
+from typing import Literal
+import os
+import random
+import statistics
+import time
+import networkx as nx
+from .utils import load_dhaka_graph
+from algorithms.k_shortest_paths import k_shortest_paths
+import matplotlib.pyplot as plt
+
+basepath = "output/benchmarks/k_shortest_paths"
+
+SEED = 42
+NUMBER_OF_QUERIES = 10
+k_values = [1, 2, 5, 10, 20, 50]
+
+def custom():
+    pass
+
+
+def real_world():
+    pass
+
+
+def benchmark():
+    os.makedirs(basepath, exist_ok=True)
+
+    print("Loading the Dhaka road network")
+    graph = load_dhaka_graph()
+    # Pairs inside the largest strongly connected component always have a route
+    nodes = sorted(max(nx.strongly_connected_components(graph), key=len))
+    rng = random.Random(SEED)
+    pairs = [tuple(rng.sample(nodes, 2)) for _ in range(NUMBER_OF_QUERIES)]
+
+    print(f"{'K':>4} {'median (ms)':>12} {'max (ms)':>10} {'paths found':>12}")
+    medians, maxima = [], []
+    for k in k_values:
+        timings, found = [], 0
+        for source, target in pairs:
+            start = time.perf_counter()
+            found += len(list(k_shortest_paths(graph, source, target, k)))
+            timings.append(time.perf_counter() - start)
+
+        medians.append(statistics.median(timings))
+        maxima.append(max(timings))
+        print(f"{k:>4} {medians[-1] * 1000:>12.1f} {maxima[-1] * 1000:>10.1f} {found / len(pairs):>12.1f}")
+
+    path = f"{basepath}/latency_vs_k.png"
+    plt.plot(k_values, medians, color="green", label="Median", marker='o')
+    plt.plot(k_values, maxima, color="red", label="Max", marker='^')
+    plt.xlabel("K (number of paths)")
+    plt.ylabel("Time per query (seconds)")
+    plt.title(f"Yen's K shortest paths on Dhaka ({NUMBER_OF_QUERIES} queries)")
+    plt.legend()
+    plt.tight_layout()
+    plt.savefig(path)
+    plt.clf()
+
+    print(f"Saved your files at {basepath}")
+
+
+def test(dataset: Literal["CUSTOM", "REAL_WORLD", "BENCHMARK"]):
+    if dataset == "CUSTOM":
+        return custom
+    elif dataset == "REAL_WORLD":
+        return real_world
+    else:
+        return benchmark
@@ -1,9 +1,13 @@
+import csv
+import json
 import random
 import math
 import networkx as nx
+from algorithms.random_graphs import random_csr_graph
 
-def create_connected_random_graph(n, p):
-    G = nx.gnp_random_graph(n, p)
+def create_connected_random_graph(n, p, seed=None):
+    rng = random.Random(seed)
+    G = nx.gnp_random_graph(n, p, seed=rng)
 
     # check connectedness
     if nx.is_connected(G):
@@ -15,23 +19,33 @@ def create_connected_random_graph(n, p):
 
     for comp in components[1:]:
         # Select one random node from the main component
-        node_from_main = random.choice(main_component)
-        node_from_other = random.choice(list(comp))
+        node_from_main = rng.choice(main_component)
+        node_from_other = rng.choice(list(comp))
         G.add_edge(node_from_main, node_from_other)        
         main_component.extend(list(comp))
 
     return G
 
 
-def add_random_weights(graph, w_min=1, w_max=20):
+def add_random_weights(graph, w_min=1, w_max=20, seed=None):
+    rng = random.Random(seed)
     for (u, v) in graph.edges():
-        graph[u][v]['weight'] = random.randint(w_min, w_max)
+        graph[u][v]['weight'] = rng.randint(w_min, w_max)
 
     return graph
 
 
-def create_arbitrary_graphs(n, p, w_min=1, w_max=20):
-    return add_random_weights(create_connected_random_graph(n, p), w_min, w_max)
+def create_arbitrary_graphs(n, p, w_min=1, w_max=20, seed=None):
+    # The same seed always gives the same weighted graph. The weights get their
+    # own seed, so that they do not replay the random stream of the edges
+    weight_seed = seed + 1 if seed is not None else None
+    return add_random_weights(create_connected_random_graph(n, p, seed), w_min, w_max, weight_seed)
+
+
+def create_random_graph(n, p, w_min=1, w_max=20, seed=None, as_networkx=True):
+    # NumPy version of create_arbitrary_graphs, built as CSR arrays; seeds give different graphs than the NetworkX one
+    graph = random_csr_graph(n, p, w_min, w_max, seed)
+    return graph.to_networkx() if as_networkx else graph
 
 
 def normalise_dijkstra_preds(nx_preds):
@@ -80,3 +94,36 @@ def compare_dijkstra_results(g, source, custom_djk_function):
             break
 
     return distances_match and predecessors_match
+
+
+def load_dhaka_graph(path="data/real_world/dhaka_road_data.txt"):
+    """Loads the Dhaka road network as a directed graph weighted by road length"""
+
+    G = nx.DiGraph()
+    with open(path, newline='') as f:
+        reader = csv.reader(f, delimiter='\t')
+        next(reader) # header
+        for source, target, weight in reader:
+            G.add_edge(int(source), int(target), weight=float(weight))
+
+    return G
+
+
+def load_node_link_graph(path):
+    with open(path) as f:
+        return nx.node_link_graph(json.load(f), edges="links")
+
+
+def load_lastfm_graph(path="data/real_world/lastfm_asia_edges.json"):
+    return load_node_link_graph(path)
+
+
+def load_epa_graph(path="data/real_world/web_EPA.json"):
+    return load_node_link_graph(path)
+
+
+real_world_loaders = {
+    "dhaka": load_dhaka_graph,
+    "lastfm": load_lastfm_graph,
+    "epa": load_epa_graph,
+}